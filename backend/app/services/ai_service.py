@@ -55,6 +55,27 @@ AVAILABLE_TEAMS = [
 
 SEVERITY_LEVELS = ["critical", "high", "medium", "low"]
 
+# Precompiled patterns for fallback field extraction, tried in order (the
+# first match wins except for emails, which are all collected). None nest
+# quantifiers, so matching stays linear per start position.
+ORDER_ID_PATTERNS = tuple(
+    re.compile(pattern, re.IGNORECASE)
+    for pattern in (r"(ORD-\d{6,})", r"(#\d{5,})", r"order[:\s]+(\d+)")
+)
+EMAIL_PATTERN = re.compile(r"([a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,})")
+PHONE_PATTERNS = tuple(
+    re.compile(pattern)
+    for pattern in (
+        r"(\+?\d{1,3}[-.\s]?\(?\d{3}\)?[-.\s]?\d{3}[-.\s]?\d{4})",
+        r"(\+?\d{10,15})",
+    )
+)
+ERROR_CODE_PATTERNS = tuple(
+    re.compile(pattern, re.IGNORECASE)
+    for pattern in (r"(ERR-\d+)", r"(0x[0-9A-Fa-f]+)", r"error[:\s]+(\d+)")
+)
+PRIORITY_KEYWORDS = ("urgent", "asap", "critical", "emergency", "immediately", "important")
+
 
 class AIServiceError(Exception):
     """Exception raised when AI service operations fail."""
@@ -200,7 +221,8 @@ class AIService:
             logger.error(f"Unexpected error calling {self.provider}: {e}")
             raise AIServiceError(f"Unexpected error: {e}")
 
-    def _parse_json_response(self, content: str) -> Dict[str, Any]:
+    @staticmethod
+    def _parse_json_response(content: str) -> Dict[str, Any]:
         """
         Parse JSON from LLM response content.
 
@@ -220,17 +242,23 @@ class AIService:
         """
         content = content.strip()
 
-        # Try to extract JSON from markdown code blocks
-        json_block_pattern = r"```(?:json)?\s*([\s\S]*?)\s*```"
-        match = re.search(json_block_pattern, content)
-        if match:
-            content = match.group(1).strip()
-
-        # Try to find JSON object in the content
-        json_object_pattern = r"\{[\s\S]*\}"
-        match = re.search(json_object_pattern, content)
-        if match:
-            content = match.group(0)
+        # Try to extract JSON from the first markdown code block. Plain
+        # string searches keep this linear where the equivalent regexes
+        # backtrack on long unterminated fences or brace runs.
+        fence_start = content.find("```")
+        if fence_start != -1:
+            block_start = fence_start + 3
+            if content.startswith("json", block_start):
+                block_start += 4
+            fence_end = content.find("```", block_start)
+            if fence_end != -1:
+                content = content[block_start:fence_end].strip()
+
+        # Try to find JSON object in the content (first "{" to last "}")
+        object_start = content.find("{")
+        object_end = content.rfind("}")
+        if object_start != -1 and object_end > object_start:
+            content = content[object_start:object_end + 1]
 
         try:
             return json.loads(content)
@@ -493,13 +521,8 @@ class AIService:
         fields = []
 
         # Order ID patterns
-        order_patterns = [
-            r"(ORD-\d{6,})",
-            r"(#\d{5,})",
-            r"order[:\s]+(\d+)",
-        ]
-        for pattern in order_patterns:
-            match = re.search(pattern, text, re.IGNORECASE)
+        for pattern in ORDER_ID_PATTERNS:
+            match = pattern.search(text)
             if match:
                 fields.append(
                     ExtractedField(
@@ -512,9 +535,7 @@ class AIService:
                 break
 
         # Email pattern
-        email_pattern = r"([a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,})"
-        email_matches = re.findall(email_pattern, text)
-        for email in email_matches:
+        for email in EMAIL_PATTERN.findall(text):
             fields.append(
                 ExtractedField(
                     name="account_email",
@@ -525,12 +546,8 @@ class AIService:
             )
 
         # Phone number pattern (various formats)
-        phone_patterns = [
-            r"(\+?\d{1,3}[-.\s]?\(?\d{3}\)?[-.\s]?\d{3}[-.\s]?\d{4})",
-            r"(\+?\d{10,15})",
-        ]
-        for pattern in phone_patterns:
-            match = re.search(pattern, text)
+        for pattern in PHONE_PATTERNS:
+            match = pattern.search(text)
             if match:
                 fields.append(
                     ExtractedField(
@@ -543,13 +560,8 @@ class AIService:
                 break
 
         # Error code patterns
-        error_patterns = [
-            r"(ERR-\d+)",
-            r"(0x[0-9A-Fa-f]+)",
-            r"error[:\s]+(\d+)",
-        ]
-        for pattern in error_patterns:
-            match = re.search(pattern, text, re.IGNORECASE)
+        for pattern in ERROR_CODE_PATTERNS:
+            match = pattern.search(text)
             if match:
                 fields.append(
                     ExtractedField(
@@ -562,8 +574,8 @@ class AIService:
                 break
 
         # Priority keywords
-        priority_keywords = ["urgent", "asap", "critical", "emergency", "immediately", "important"]
-        found_keywords = [kw for kw in priority_keywords if kw.lower() in text.lower()]
+        lowered = text.lower()
+        found_keywords = [kw for kw in PRIORITY_KEYWORDS if kw in lowered]
         if found_keywords:
             fields.append(
                 ExtractedField(
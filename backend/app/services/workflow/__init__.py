@@ -45,6 +45,7 @@ from app.services.workflow.validators import (
     ValidationResult,
     PROMPT_INJECTION_PATTERNS,
     validate_ticket,
+    validate_tickets,
 )
 
 __all__ = [
@@ -82,4 +83,5 @@ __all__ = [
     "ValidationResult",
     "PROMPT_INJECTION_PATTERNS",
     "validate_ticket",
+    "validate_tickets",
 ]
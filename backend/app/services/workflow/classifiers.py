@@ -6,16 +6,29 @@ including LLM-based classification via AIService and fallback rule-based
 classification using keyword matching from configuration.
 """
 
+import asyncio
+import hashlib
 import logging
 import re
+from collections import OrderedDict
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
 
 import yaml
 
 from app.core.config import settings
 from app.schemas import ClassificationResult
 
+try:
+    from yaml import CSafeLoader as YamlSafeLoader
+except ImportError:  # pragma: no cover - PyYAML built without libyaml
+    from yaml import SafeLoader as YamlSafeLoader
+
+try:
+    import ahocorasick
+except ImportError:  # pragma: no cover - optional accelerator
+    ahocorasick = None
+
 logger = logging.getLogger(__name__)
 
 # Path to categories configuration file
@@ -44,13 +57,47 @@ SEVERITY_INDICATORS: Dict[str, List[str]] = {
 VALID_CATEGORIES = ["technical", "billing", "account", "feature_request", "bug_report", "general"]
 VALID_SEVERITIES = ["critical", "high", "medium", "low"]
 
+# Hashed lookups for validation, and severity rank (0 = most severe) for
+# breaking ties between equally confident severities
+_VALID_CATEGORY_SET = frozenset(VALID_CATEGORIES)
+_VALID_SEVERITY_SET = frozenset(VALID_SEVERITIES)
+_SEVERITY_RANK = {severity: rank for rank, severity in enumerate(VALID_SEVERITIES)}
+
+# Number of rule-based results memoized per classifier. Entries are keyed
+# by a 16-byte digest of (subject, body), never the ticket text itself, so
+# a full cache holds about 1 KB per entry (roughly 1 MB in total) however
+# long the tickets were, and keeps no customer text alive. Unique tickets
+# rarely hit; the cache pays off for retries and duplicate submissions.
+RULE_CACHE_SIZE = 1024
+
+
+def _rule_cache_key(subject: str, body: str) -> bytes:
+    """
+    Digest a ticket's text into a fixed-size rule cache key.
+
+    The subject length is hashed first, so moving text between subject
+    and body changes the key.
+
+    Args:
+        subject: Ticket subject line
+        body: Ticket body content
+
+    Returns:
+        16-byte BLAKE2b digest of (subject, body)
+    """
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update(f"{len(subject)}:".encode())
+    digest.update(subject.encode("utf-8", "surrogatepass"))
+    digest.update(body.encode("utf-8", "surrogatepass"))
+    return digest.digest()
+
 
 def _load_yaml_config(file_path: Path) -> Optional[Dict[str, Any]]:
     """Load configuration from YAML file."""
     try:
         if file_path.exists():
             with open(file_path, "r") as f:
-                return yaml.safe_load(f)
+                return yaml.load(f, Loader=YamlSafeLoader)
     except Exception as e:
         logger.warning(f"Failed to load config from {file_path}: {e}")
     return None
@@ -80,6 +127,120 @@ def _extract_severity_indicators_from_config(config: Optional[Dict[str, Any]]) -
     return indicators
 
 
+def _is_word_char(char: str) -> bool:
+    """Return whether a character belongs to the regex ``\\w`` class."""
+    return char.isalnum() or char == "_"
+
+
+def _has_word_boundaries(text: str, start: int, end: int) -> bool:
+    """
+    Check that ``text[start:end]`` is delimited like ``\\b...\\b`` in a regex.
+
+    A boundary holds where exactly one side of it is a word character,
+    with the ends of the text counting as non-word characters.
+
+    Args:
+        text: Text containing the match
+        start: Index of the first matched character
+        end: Index just past the last matched character
+
+    Returns:
+        True if both ends of the match fall on word boundaries
+    """
+    before = start > 0 and _is_word_char(text[start - 1])
+    after = end < len(text) and _is_word_char(text[end])
+    return (
+        before != _is_word_char(text[start])
+        and _is_word_char(text[end - 1]) != after
+    )
+
+
+def _truncate_at_word_boundary(text: str, limit: int) -> str:
+    """
+    Cut text to at most ``limit`` characters without splitting a word.
+
+    Splitting a word could create a keyword match that is not in the
+    text (e.g. "billing" cut to "bill").
+
+    Args:
+        text: Text to truncate
+        limit: Maximum number of characters to keep
+
+    Returns:
+        The text itself if short enough, otherwise its longest prefix of
+        at most ``limit`` characters that ends on a word boundary
+    """
+    if len(text) <= limit:
+        return text
+
+    cut = limit
+    while cut > 0 and _is_word_char(text[cut - 1]) and _is_word_char(text[cut]):
+        cut -= 1
+    return text[:cut]
+
+
+def _build_keyword_automaton(keywords: Iterable[str]) -> Optional[Any]:
+    """
+    Build an Aho-Corasick automaton over lowercase keywords.
+
+    Args:
+        keywords: Non-empty lowercase keywords to match
+
+    Returns:
+        Automaton instance, or None if pyahocorasick is not installed or
+        there are no keywords
+    """
+    keywords = list(keywords)
+    if ahocorasick is None or not keywords:
+        return None
+
+    automaton = ahocorasick.Automaton()
+    for keyword in keywords:
+        automaton.add_word(keyword, keyword)
+    automaton.make_automaton()
+    return automaton
+
+
+def _index_by_lowercase(table: Dict[str, List[str]]) -> Dict[str, List[Tuple[str, int, str]]]:
+    """
+    Invert a keyword table so each lowercase keyword maps to where it is declared.
+
+    Args:
+        table: Mapping of category or severity to keywords
+
+    Returns:
+        Mapping of lowercase keyword to (name, position, keyword) entries
+    """
+    index: Dict[str, List[Tuple[str, int, str]]] = {}
+    for name, keywords in table.items():
+        for position, keyword in enumerate(keywords):
+            index.setdefault(keyword.lower(), []).append((name, position, keyword))
+    return index
+
+
+def _group_found(
+    index: Dict[str, List[Tuple[str, int, str]]], found: Set[str]
+) -> Dict[str, List[str]]:
+    """
+    Group found keywords by the category or severity that declares them.
+
+    Only the found keywords are visited, rather than every keyword of
+    every table entry.
+
+    Args:
+        index: Inverted keyword table from _index_by_lowercase
+        found: Lowercase keywords found in the text
+
+    Returns:
+        Mapping of name to its matched keywords, in declaration order
+    """
+    hits: Dict[str, List[Tuple[int, str]]] = {}
+    for lowered in found:
+        for name, position, keyword in index.get(lowered, ()):
+            hits.setdefault(name, []).append((position, keyword))
+    return {name: [keyword for _, keyword in sorted(entries)] for name, entries in hits.items()}
+
+
 class TicketClassifier:
     """
     Ticket classifier supporting both AI-based and rule-based classification.
@@ -94,6 +255,7 @@ class TicketClassifier:
         severity_indicators: Dictionary mapping severities to their indicators
         enable_ai: Whether AI-based classification is enabled
         confidence_threshold: Minimum confidence threshold for AI results
+        max_scan_chars: Body length cap for rule-based scanning (None = no cap)
     """
 
     def __init__(
@@ -101,6 +263,7 @@ class TicketClassifier:
         ai_service: Optional[Any] = None,
         enable_ai: Optional[bool] = None,
         confidence_threshold: Optional[float] = None,
+        max_scan_chars: Optional[int] = None,
     ):
         """
         Initialize the ticket classifier.
@@ -109,14 +272,23 @@ class TicketClassifier:
             ai_service: Optional AIService instance for LLM-based classification
             enable_ai: Override for AI classification enable flag
             confidence_threshold: Override for confidence threshold
+            max_scan_chars: Maximum number of body characters scanned by
+                rule-based classification, or None to scan the whole body.
+                Keywords past the limit are ignored.
         """
         self.ai_service = ai_service
         self.enable_ai = enable_ai if enable_ai is not None else settings.ENABLE_AI_CLASSIFICATION
         self.confidence_threshold = confidence_threshold or settings.AI_CONFIDENCE_THRESHOLD
+        self.max_scan_chars = max_scan_chars
 
         # Load keywords from config files, fallback to defaults
         self._load_keywords()
 
+        # Rule-based results depend only on (subject, body) once the keyword
+        # tables are loaded, so repeated tickets skip the keyword scan. Least
+        # recently used entries are evicted past RULE_CACHE_SIZE.
+        self._rule_cache: "OrderedDict[bytes, ClassificationResult]" = OrderedDict()
+
     def _load_keywords(self) -> None:
         """Load category keywords and severity indicators from config files."""
         global CATEGORY_KEYWORDS, SEVERITY_INDICATORS
@@ -138,11 +310,55 @@ class TicketClassifier:
         else:
             self.severity_indicators = SEVERITY_INDICATORS.copy()
 
+        self._build_keyword_matcher()
+
         logger.debug(
             f"Loaded {len(self.category_keywords)} category keyword sets "
             f"and {len(self.severity_indicators)} severity indicator sets"
         )
 
+    def _build_keyword_matcher(self) -> None:
+        """
+        Prepare a single scanner over all category keywords and severity indicators.
+
+        Keywords are matched with one Aho-Corasick pass over the text when
+        pyahocorasick is installed. Otherwise, and for empty keywords, each
+        keyword gets a precompiled word-boundary regex. Both tables are also
+        inverted by lowercase keyword, so scoring only visits found keywords.
+        """
+        self._category_keyword_index = _index_by_lowercase(self.category_keywords)
+        self._severity_indicator_index = _index_by_lowercase(self.severity_indicators)
+        keywords = self._category_keyword_index.keys() | self._severity_indicator_index.keys()
+        self._keyword_automaton = _build_keyword_automaton(kw for kw in keywords if kw)
+        self._keyword_patterns = {
+            keyword: re.compile(r"\b" + re.escape(keyword) + r"\b")
+            for keyword in keywords
+            if self._keyword_automaton is None or not keyword
+        }
+
+    def _find_keywords(self, text: str) -> Set[str]:
+        """
+        Find which keywords occur in the text as whole words.
+
+        Args:
+            text: Combined subject and body text (lowercase)
+
+        Returns:
+            Set of matched lowercase keywords
+        """
+        found = {
+            keyword
+            for keyword, pattern in self._keyword_patterns.items()
+            if pattern.search(text)
+        }
+        if self._keyword_automaton is not None:
+            for end, keyword in self._keyword_automaton.iter(text):
+                if keyword not in found and _has_word_boundaries(
+                    text, end - len(keyword) + 1, end + 1
+                ):
+                    found.add(keyword)
+        return found
+
     async def classify(
         self,
         subject: str,
@@ -178,7 +394,82 @@ class TicketClassifier:
                 logger.warning(f"AI classification failed: {e}, falling back to rule-based")
 
         # Fallback to rule-based classification
-        return self._classify_with_rules(subject, body)
+        return self.classify_sync(subject, body)
+
+    def classify_sync(self, subject: str, body: str) -> ClassificationResult:
+        """
+        Classify a support ticket using rule-based keyword matching only.
+
+        Rule-based classification is pure CPU work, so callers that never
+        use AI can call this directly instead of awaiting classify().
+
+        Args:
+            subject: Ticket subject line
+            body: Ticket body content
+
+        Returns:
+            ClassificationResult with category, severity, and confidence scores
+        """
+        if self.max_scan_chars is not None:
+            body = _truncate_at_word_boundary(body, self.max_scan_chars)
+
+        key = _rule_cache_key(subject, body)
+        result = self._rule_cache.get(key)
+        if result is None:
+            result = self._classify_with_rules(subject, body)
+            self._rule_cache[key] = result
+            if len(self._rule_cache) > RULE_CACHE_SIZE:
+                self._rule_cache.popitem(last=False)
+        else:
+            self._rule_cache.move_to_end(key)
+        return self._copy_result(result)
+
+    async def classify_many(
+        self,
+        tickets: List[Tuple[str, str]],
+        use_ai: Optional[bool] = None,
+    ) -> List[ClassificationResult]:
+        """
+        Classify a batch of tickets, e.g. for bulk imports or backfills.
+
+        With AI enabled the tickets are classified concurrently; otherwise
+        the rule-based path runs in a plain loop without scheduling a task
+        per ticket.
+
+        Args:
+            tickets: (subject, body) pairs to classify
+            use_ai: Override for whether to use AI classification
+
+        Returns:
+            List of ClassificationResult, in the same order as tickets
+        """
+        should_use_ai = use_ai if use_ai is not None else self.enable_ai
+
+        if should_use_ai and self.ai_service:
+            return list(
+                await asyncio.gather(
+                    *(self.classify(subject, body, use_ai=True) for subject, body in tickets)
+                )
+            )
+
+        classify_sync = self.classify_sync
+        return [classify_sync(subject, body) for subject, body in tickets]
+
+    @staticmethod
+    def _copy_result(result: ClassificationResult) -> ClassificationResult:
+        """
+        Copy a memoized rule-based result with fresh lists callers may mutate.
+
+        Re-validating the field values builds new lists and, with
+        pydantic-core, is cheaper than model_copy() with an update dict.
+
+        Args:
+            result: Cached classification result
+
+        Returns:
+            Independent copy of the result
+        """
+        return ClassificationResult.model_validate(result.__dict__)
 
     async def _classify_with_ai(self, subject: str, body: str) -> ClassificationResult:
         """
@@ -211,15 +502,24 @@ class TicketClassifier:
             ClassificationResult from rule-based classification
         """
         combined_text = f"{subject} {body}".lower()
+        found = self._find_keywords(combined_text)
+        # Shared by the primary and secondary category matching
+        matched = _group_found(self._category_keyword_index, found)
 
         # Classify category
-        category, category_confidence, keywords_matched = self._match_category(combined_text)
+        category, category_confidence, keywords_matched = self._match_category(
+            combined_text, found, matched
+        )
 
         # Classify severity
-        severity, severity_confidence, urgency_indicators = self._match_severity(combined_text)
+        severity, severity_confidence, urgency_indicators = self._match_severity(
+            combined_text, found
+        )
 
         # Find secondary categories
-        secondary_categories = self._find_secondary_categories(combined_text, category)
+        secondary_categories = self._find_secondary_categories(
+            combined_text, category, found, matched
+        )
 
         # Generate reasoning
         reasoning = self._generate_reasoning(category, severity, keywords_matched, urgency_indicators)
@@ -235,25 +535,33 @@ class TicketClassifier:
             urgency_indicators=urgency_indicators,
         )
 
-    def _match_category(self, text: str) -> Tuple[str, float, List[str]]:
+    def _match_category(
+        self,
+        text: str,
+        found: Optional[Set[str]] = None,
+        matched: Optional[Dict[str, List[str]]] = None,
+    ) -> Tuple[str, float, List[str]]:
         """
         Match text against category keywords.
 
         Args:
             text: Combined subject and body text (lowercase)
+            found: Keywords already found in text by _find_keywords
+            matched: Found keywords already grouped by category
 
         Returns:
             Tuple of (category, confidence, matched_keywords)
         """
+        if matched is None:
+            if found is None:
+                found = self._find_keywords(text)
+            # Keywords match as whole words (see _find_keywords)
+            matched = _group_found(self._category_keyword_index, found)
         scores: Dict[str, Tuple[float, List[str]]] = {}
 
+        # Iterate in declaration order so ties resolve as before
         for category, keywords in self.category_keywords.items():
-            matches = []
-            for keyword in keywords:
-                # Use word boundary matching for more accuracy
-                pattern = r"\b" + re.escape(keyword.lower()) + r"\b"
-                if re.search(pattern, text):
-                    matches.append(keyword)
+            matches = matched.get(category)
 
             if matches:
                 # Calculate confidence based on match ratio
@@ -271,24 +579,27 @@ class TicketClassifier:
         # Default to general if no matches
         return "general", 0.3, []
 
-    def _match_severity(self, text: str) -> Tuple[str, float, List[str]]:
+    def _match_severity(
+        self, text: str, found: Optional[Set[str]] = None
+    ) -> Tuple[str, float, List[str]]:
         """
         Match text against severity indicators.
 
         Args:
             text: Combined subject and body text (lowercase)
+            found: Keywords already found in text by _find_keywords
 
         Returns:
             Tuple of (severity, confidence, matched_indicators)
         """
+        if found is None:
+            found = self._find_keywords(text)
         scores: Dict[str, Tuple[float, List[str]]] = {}
 
+        matched = _group_found(self._severity_indicator_index, found)
+
         for severity, indicators in self.severity_indicators.items():
-            matches = []
-            for indicator in indicators:
-                pattern = r"\b" + re.escape(indicator.lower()) + r"\b"
-                if re.search(pattern, text):
-                    matches.append(indicator)
+            matches = matched.get(severity)
 
             if matches:
                 match_ratio = len(matches) / len(indicators) if indicators else 0
@@ -299,7 +610,7 @@ class TicketClassifier:
             # Return severity with highest confidence, preferring higher severity
             sorted_severities = sorted(
                 scores.keys(),
-                key=lambda k: (scores[k][0], VALID_SEVERITIES.index(k) if k in VALID_SEVERITIES else 99),
+                key=lambda k: (scores[k][0], _SEVERITY_RANK.get(k, 99)),
                 reverse=True,
             )
             best_severity = sorted_severities[0]
@@ -309,24 +620,36 @@ class TicketClassifier:
         # Default to medium severity
         return "medium", 0.5, []
 
-    def _find_secondary_categories(self, text: str, primary_category: str) -> List[str]:
+    def _find_secondary_categories(
+        self,
+        text: str,
+        primary_category: str,
+        found: Optional[Set[str]] = None,
+        matched: Optional[Dict[str, List[str]]] = None,
+    ) -> List[str]:
         """
         Find secondary categories that also match the text.
 
         Args:
             text: Combined subject and body text (lowercase)
             primary_category: The primary matched category
+            found: Keywords already found in text by _find_keywords
+            matched: Found keywords already grouped by category
 
         Returns:
             List of secondary category names
         """
+        if matched is None:
+            if found is None:
+                found = self._find_keywords(text)
+            matched = _group_found(self._category_keyword_index, found)
         secondary = []
 
-        for category, keywords in self.category_keywords.items():
+        for category in self.category_keywords:
             if category == primary_category:
                 continue
 
-            match_count = sum(1 for kw in keywords if re.search(r"\b" + re.escape(kw.lower()) + r"\b", text))
+            match_count = len(matched.get(category, ()))
             if match_count >= 2:  # Require at least 2 keyword matches for secondary
                 secondary.append(category)
 
@@ -393,7 +716,7 @@ class TicketClassifier:
         Returns:
             True if category is valid, False otherwise
         """
-        return category in VALID_CATEGORIES
+        return category in _VALID_CATEGORY_SET
 
     def validate_severity(self, severity: str) -> bool:
         """
@@ -405,4 +728,4 @@ class TicketClassifier:
         Returns:
             True if severity is valid, False otherwise
         """
-        return severity in VALID_SEVERITIES
+        return severity in _VALID_SEVERITY_SET
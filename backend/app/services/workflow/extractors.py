@@ -6,9 +6,11 @@ including regex-based patterns for structured data and AI-assisted
 extraction for context-dependent fields.
 """
 
+import asyncio
 import logging
 import re
-from typing import Any, Dict, List, Optional, Tuple
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Set, Tuple
 
 from app.core.config import settings
 from app.schemas import ExtractedField, ExtractionResult
@@ -75,6 +77,26 @@ PRIORITY_KEYWORDS = [
     "as soon as possible", "right away", "help me",
 ]
 
+# Keywords that only count as whole words. Other keywords also match with
+# any word-character tail ("urgently", "criticality", "urgent_fix"), but
+# "now" would then match "nowhere" and "nowadays".
+PRIORITY_WHOLE_WORD_KEYWORDS = ["now"]
+
+# One pass finds every priority keyword at the start of a word, so "now"
+# is never found inside "know" or "acknowledge". The alternation sits in a
+# lookahead so matches may overlap ("soon" inside "as soon as possible");
+# longer keywords come first so each start position reports the longest
+# keyword beginning there.
+PRIORITY_KEYWORDS_PATTERN = re.compile(
+    r"(?=\b("
+    + "|".join(
+        re.escape(keyword) + (r"(?!\w)" if keyword in PRIORITY_WHOLE_WORD_KEYWORDS else "")
+        for keyword in sorted(PRIORITY_KEYWORDS, key=len, reverse=True)
+    )
+    + r"))",
+    re.IGNORECASE,
+)
+
 # Required fields per category
 CATEGORY_REQUIRED_FIELDS = {
     "technical": ["error_code"],
@@ -93,6 +115,65 @@ VALIDATION_PATTERNS = {
     "error_code": r"^[A-Z0-9\-_]{3,15}$",
 }
 
+# Flags applied to every extraction pattern
+EXTRACTION_FLAGS = re.IGNORECASE | re.MULTILINE
+
+# On ASCII text, ASCII-mode patterns find exactly the same matches, and
+# skip Unicode case folding and character classification. The one
+# exception is the information separators U+001C-U+001F, which only
+# Unicode-mode \s matches, so text containing them uses Unicode mode.
+_UNICODE_ONLY_SPACE_PATTERN = re.compile(r"[\x1c-\x1f]")
+
+# Validation patterns compiled once rather than looked up in re's cache per field
+_COMPILED_VALIDATION_PATTERNS = {
+    name: re.compile(pattern, re.IGNORECASE) for name, pattern in VALIDATION_PATTERNS.items()
+}
+
+# Characters stripped from phone numbers, and non-digits for length checks
+_PHONE_STRIP_PATTERN = re.compile(r"[^\d\+\-\(\)\s]")
+_NON_DIGIT_PATTERN = re.compile(r"\D")
+
+# Number of (field name, value) format checks memoized across extractors
+VALIDATION_CACHE_SIZE = 1024
+
+
+@lru_cache(maxsize=VALIDATION_CACHE_SIZE)
+def _matches_expected_format(field_name: str, value: str) -> bool:
+    """
+    Check a value against its field's validation pattern.
+
+    Regex values are checked once for the confidence boost and again when
+    the result is validated, so the second check is a cache hit.
+
+    Args:
+        field_name: Name of a field in VALIDATION_PATTERNS
+        value: Value to check
+
+    Returns:
+        True if the value matches the expected format
+    """
+    return _COMPILED_VALIDATION_PATTERNS[field_name].match(value) is not None
+
+
+def _ascii_variant(pattern: str, compiled: re.Pattern) -> re.Pattern:
+    """
+    Compile the ASCII-mode variant of an extraction pattern.
+
+    Patterns that request Unicode mode inline, e.g. "(?u)", cannot be
+    combined with re.ASCII, so they keep their Unicode-mode compilation.
+
+    Args:
+        pattern: Extraction pattern source
+        compiled: The pattern compiled with EXTRACTION_FLAGS
+
+    Returns:
+        Pattern to use for ASCII text
+    """
+    try:
+        return re.compile(pattern, EXTRACTION_FLAGS | re.ASCII)
+    except ValueError:
+        return compiled
+
 
 class FieldExtractor:
     """
@@ -126,7 +207,19 @@ class FieldExtractor:
         self.ai_service = ai_service
         self.enable_ai = enable_ai if enable_ai is not None else settings.ENABLE_AI_EXTRACTION
         self.confidence_threshold = confidence_threshold or settings.AI_CONFIDENCE_THRESHOLD
-        self.patterns = EXTRACTION_PATTERNS.copy()
+        # Copy the lists too, so custom patterns stay local to this instance
+        self.patterns = {name: list(patterns) for name, patterns in EXTRACTION_PATTERNS.items()}
+        self._compiled_patterns = {
+            name: [re.compile(pattern, EXTRACTION_FLAGS) for pattern in patterns]
+            for name, patterns in self.patterns.items()
+        }
+        self._ascii_patterns = {
+            name: [
+                _ascii_variant(pattern, compiled)
+                for pattern, compiled in zip(patterns, self._compiled_patterns[name])
+            ]
+            for name, patterns in self.patterns.items()
+        }
 
     async def extract(
         self,
@@ -150,10 +243,94 @@ class FieldExtractor:
         Returns:
             ExtractionResult with extracted fields and validation info
         """
-        combined_text = f"{subject}\n{body}"
         should_use_ai = use_ai if use_ai is not None else self.enable_ai
+        if not (should_use_ai and self.ai_service):
+            return self.extract_sync(subject, body, category)
 
         # Start with regex-based extraction
+        fields = self._extract_with_rules(subject, body)
+
+        # Enhance with AI extraction
+        try:
+            ai_fields = await self._extract_with_ai(subject, body, category)
+            fields = self._merge_fields(fields, ai_fields)
+        except Exception as e:
+            logger.warning(f"AI extraction failed: {e}, using regex-only results")
+
+        return self._build_result(fields, category)
+
+    def extract_sync(
+        self,
+        subject: str,
+        body: str,
+        category: Optional[str] = None,
+    ) -> ExtractionResult:
+        """
+        Extract fields from a support ticket using regex patterns only.
+
+        Rule-based extraction is pure CPU work, so callers that never use
+        AI can call this directly instead of awaiting extract().
+
+        Args:
+            subject: Ticket subject line
+            body: Ticket body content
+            category: Ticket category for context-aware extraction
+
+        Returns:
+            ExtractionResult with extracted fields and validation info
+        """
+        return self._build_result(self._extract_with_rules(subject, body), category)
+
+    async def extract_many(
+        self,
+        tickets: List[Tuple[str, str, Optional[str]]],
+        use_ai: Optional[bool] = None,
+    ) -> List[ExtractionResult]:
+        """
+        Extract fields from a batch of tickets, e.g. for bulk imports.
+
+        With AI enabled the tickets are extracted concurrently; otherwise
+        the regex path runs in a plain loop without scheduling a task per
+        ticket.
+
+        Args:
+            tickets: (subject, body, category) triples to extract from
+            use_ai: Override for whether to use AI extraction
+
+        Returns:
+            List of ExtractionResult, in the same order as tickets
+        """
+        should_use_ai = use_ai if use_ai is not None else self.enable_ai
+
+        if should_use_ai and self.ai_service:
+            return list(
+                await asyncio.gather(
+                    *(
+                        self.extract(subject, body, category, use_ai=True)
+                        for subject, body, category in tickets
+                    )
+                )
+            )
+
+        extract_sync = self.extract_sync
+        return [extract_sync(subject, body, category) for subject, body, category in tickets]
+
+    def _extract_with_rules(self, subject: str, body: str) -> List[ExtractedField]:
+        """
+        Extract regex fields and priority keywords from a ticket.
+
+        Args:
+            subject: Ticket subject line
+            body: Ticket body content
+
+        Returns:
+            List of ExtractedField objects
+        """
+        if not subject and not body:
+            # Nothing to scan; no pattern can match the lone separator
+            return []
+
+        combined_text = f"{subject}\n{body}"
         fields = self._extract_with_regex(combined_text)
 
         # Extract priority keywords
@@ -168,15 +345,21 @@ class FieldExtractor:
                 )
             )
 
-        # Optionally enhance with AI extraction
-        if should_use_ai and self.ai_service:
-            try:
-                ai_fields = await self._extract_with_ai(subject, body, category)
-                fields = self._merge_fields(fields, ai_fields)
-            except Exception as e:
-                logger.warning(f"AI extraction failed: {e}, using regex-only results")
+        return fields
 
-        # Validate fields and find missing required fields
+    def _build_result(
+        self, fields: List[ExtractedField], category: Optional[str]
+    ) -> ExtractionResult:
+        """
+        Validate extracted fields and package them as an ExtractionResult.
+
+        Args:
+            fields: Extracted fields
+            category: Ticket category used to find missing required fields
+
+        Returns:
+            ExtractionResult with fields, missing required fields and errors
+        """
         validation_errors = self._validate_fields(fields)
         missing_required = self._find_missing_required(fields, category)
 
@@ -190,6 +373,9 @@ class FieldExtractor:
         """
         Extract fields using regex patterns.
 
+        Every pattern scans the text on its own, so a span may yield values
+        for several fields (e.g. an order number that is also a date).
+
         Args:
             text: Text to extract fields from
 
@@ -197,15 +383,22 @@ class FieldExtractor:
             List of ExtractedField objects
         """
         fields = []
-        found_values: Dict[str, set] = {}  # Track found values to avoid duplicates
 
-        for field_name, patterns in self.patterns.items():
+        if text.isascii() and _UNICODE_ONLY_SPACE_PATTERN.search(text) is None:
+            compiled_patterns = self._ascii_patterns
+        else:
+            compiled_patterns = self._compiled_patterns
+
+        for field_name, patterns in compiled_patterns.items():
+            # Values already extracted for this field, so duplicates are
+            # skipped before an ExtractedField is built
+            seen: Set[str] = set()
             for pattern in patterns:
-                matches = re.finditer(pattern, text, re.IGNORECASE | re.MULTILINE)
-                for match in matches:
+                for match in pattern.finditer(text):
                     # Get the full match or first group
-                    if match.groups():
-                        value = match.group(1) if len(match.groups()) == 1 else "".join(match.groups())
+                    groups = match.groups()
+                    if groups:
+                        value = groups[0] if len(groups) == 1 else "".join(groups)
                     else:
                         value = match.group(0)
 
@@ -219,12 +412,9 @@ class FieldExtractor:
                     value = self._normalize_value(field_name, value)
 
                     # Skip duplicates
-                    if field_name in found_values and value in found_values[field_name]:
+                    if value in seen:
                         continue
-
-                    if field_name not in found_values:
-                        found_values[field_name] = set()
-                    found_values[field_name].add(value)
+                    seen.add(value)
 
                     # Calculate confidence based on pattern specificity
                     confidence = self._calculate_regex_confidence(field_name, value)
@@ -255,7 +445,7 @@ class FieldExtractor:
             return value.lower().strip()
         elif field_name == "phone_number":
             # Keep only digits and common separators
-            return re.sub(r"[^\d\+\-\(\)\s]", "", value)
+            return _PHONE_STRIP_PATTERN.sub("", value)
         elif field_name == "order_id":
             return value.upper().strip()
         elif field_name == "error_code":
@@ -280,8 +470,8 @@ class FieldExtractor:
         base_confidence = 0.7
 
         # Boost confidence for fields with validation patterns
-        if field_name in VALIDATION_PATTERNS:
-            if re.match(VALIDATION_PATTERNS[field_name], value, re.IGNORECASE):
+        if field_name in _COMPILED_VALIDATION_PATTERNS:
+            if _matches_expected_format(field_name, value):
                 base_confidence += 0.15
 
         # Boost confidence for typical lengths
@@ -289,7 +479,7 @@ class FieldExtractor:
             base_confidence += 0.1
         elif field_name == "order_id" and 5 <= len(value) <= 20:
             base_confidence += 0.1
-        elif field_name == "phone_number" and 7 <= len(re.sub(r"\D", "", value)) <= 15:
+        elif field_name == "phone_number" and 7 <= len(_NON_DIGIT_PATTERN.sub("", value)) <= 15:
             base_confidence += 0.1
 
         return min(0.95, base_confidence)
@@ -298,20 +488,21 @@ class FieldExtractor:
         """
         Extract priority/urgency keywords from text.
 
+        Keywords match at the start of a word and may continue into a
+        longer word, so "urgently" and "urgent_fix" report "urgent".
+        Keywords in PRIORITY_WHOLE_WORD_KEYWORDS only match whole words,
+        and no keyword is found in the middle of a word, so "now" is found
+        in neither "know" nor "nowhere". Words that merely share a stem
+        with a keyword, such as "urgency", are not matched.
+
         Args:
             text: Text to search for priority keywords
 
         Returns:
-            List of found priority keywords
+            List of found priority keywords, in PRIORITY_KEYWORDS order
         """
-        found = []
-        text_lower = text.lower()
-
-        for keyword in PRIORITY_KEYWORDS:
-            if keyword.lower() in text_lower:
-                found.append(keyword)
-
-        return found
+        found = {match.casefold() for match in PRIORITY_KEYWORDS_PATTERN.findall(text)}
+        return [keyword for keyword in PRIORITY_KEYWORDS if keyword in found]
 
     async def _extract_with_ai(
         self,
@@ -385,9 +576,8 @@ class FieldExtractor:
         errors = []
 
         for field in fields:
-            if field.name in VALIDATION_PATTERNS:
-                pattern = VALIDATION_PATTERNS[field.name]
-                if not re.match(pattern, str(field.value), re.IGNORECASE):
+            if field.name in _COMPILED_VALIDATION_PATTERNS:
+                if not _matches_expected_format(field.name, str(field.value)):
                     errors.append(
                         f"Field '{field.name}' with value '{field.value}' "
                         f"does not match expected format"
@@ -410,10 +600,11 @@ class FieldExtractor:
         Returns:
             List of missing required field names
         """
-        if not category or category not in CATEGORY_REQUIRED_FIELDS:
+        required = CATEGORY_REQUIRED_FIELDS.get(category) if category else None
+        if not required:
+            # Unknown categories and those without required fields
             return []
 
-        required = CATEGORY_REQUIRED_FIELDS[category]
         found_fields = {field.name for field in fields}
 
         return [field for field in required if field not in found_fields]
@@ -450,10 +641,13 @@ class FieldExtractor:
         Returns:
             ExtractedField with highest confidence, or None if not found
         """
-        matching = self.get_fields_by_name(fields, name)
-        if not matching:
-            return None
-        return max(matching, key=lambda f: f.confidence)
+        # Single pass without building the filtered list; ties keep the
+        # earliest field, as max() returns the first maximal item
+        return max(
+            (f for f in fields if f.name == name),
+            key=lambda f: f.confidence,
+            default=None,
+        )
 
     def get_fields_as_dict(
         self,
@@ -489,10 +683,15 @@ class FieldExtractor:
         Args:
             field_name: Name of the field to extract
             pattern: Regex pattern to use for extraction
+
+        Raises:
+            re.error: If the pattern is not a valid regular expression
         """
-        if field_name not in self.patterns:
-            self.patterns[field_name] = []
-        self.patterns[field_name].append(pattern)
+        compiled = re.compile(pattern, EXTRACTION_FLAGS)
+        ascii_compiled = _ascii_variant(pattern, compiled)
+        self.patterns.setdefault(field_name, []).append(pattern)
+        self._compiled_patterns.setdefault(field_name, []).append(compiled)
+        self._ascii_patterns.setdefault(field_name, []).append(ascii_compiled)
 
     def get_extraction_patterns(self) -> Dict[str, List[str]]:
         """
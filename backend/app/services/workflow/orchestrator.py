@@ -8,6 +8,7 @@ response generation, and routing.
 
 import asyncio
 import logging
+import math
 import time
 import uuid
 from dataclasses import dataclass, field
@@ -36,7 +37,7 @@ from app.services.workflow.validators import InputValidator, ValidationResult
 logger = logging.getLogger(__name__)
 
 
-@dataclass
+@dataclass(slots=True)
 class WorkflowContext:
     """
     Context object passed between workflow steps.
@@ -53,7 +54,7 @@ class WorkflowContext:
         duplicate_of: ID of duplicate ticket if detected
         similarity_score: Similarity score for duplicate detection
         steps: List of workflow step results
-        start_time: Workflow start timestamp
+        start_time: Workflow start time from time.perf_counter()
         errors: Set of errors encountered during execution
     """
 
@@ -68,7 +69,7 @@ class WorkflowContext:
     duplicate_of: Optional[str] = None
     similarity_score: Optional[float] = None
     steps: List[WorkflowStepResult] = field(default_factory=list)
-    start_time: float = field(default_factory=time.time)
+    start_time: float = field(default_factory=time.perf_counter)
     errors: Set[str] = field(default_factory=set)
 
 
@@ -646,7 +647,7 @@ class WorkflowOrchestrator:
         Returns:
             WorkflowResponse with all results
         """
-        total_duration = int((time.time() - context.start_time) * 1000)
+        total_duration = self._total_duration_ms(context)
 
         return WorkflowResponse(
             ticket_id=context.ticket_id,
@@ -672,6 +673,22 @@ class WorkflowOrchestrator:
             created_at=datetime.utcnow(),
         )
 
+    @staticmethod
+    def _total_duration_ms(context: WorkflowContext) -> int:
+        """
+        Compute the total workflow duration in whole milliseconds.
+
+        Rule-based runs can finish in well under a millisecond, so the
+        duration is rounded up and a finished run reports at least 1 ms.
+
+        Args:
+            context: Workflow context
+
+        Returns:
+            Elapsed milliseconds since the workflow started
+        """
+        return max(1, math.ceil((time.perf_counter() - context.start_time) * 1000))
+
     def _build_error_response(
         self,
         context: WorkflowContext,
@@ -687,7 +704,7 @@ class WorkflowOrchestrator:
         Returns:
             WorkflowResponse with error information
         """
-        total_duration = int((time.time() - context.start_time) * 1000)
+        total_duration = self._total_duration_ms(context)
 
         # Add error step if not already present
         if not any(s.step_name == "error" for s in context.steps):
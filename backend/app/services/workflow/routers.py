@@ -6,14 +6,21 @@ including rule-based routing and optional AI-assisted routing.
 """
 
 import logging
+from functools import lru_cache
+from itertools import islice, product
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 import yaml
 
 from app.core.config import settings
 from app.schemas import RoutingDecision
 
+try:
+    from yaml import CSafeLoader as YamlSafeLoader
+except ImportError:  # pragma: no cover - PyYAML built without libyaml
+    from yaml import SafeLoader as YamlSafeLoader
+
 logger = logging.getLogger(__name__)
 
 # Path to routing configuration file
@@ -75,6 +82,10 @@ SEVERITY_PRIORITY_MAP = {
     "low": "low",
 }
 
+# Priority levels in ascending order, and each level's position for modifiers
+PRIORITY_LEVELS = ("low", "normal", "high", "urgent")
+PRIORITY_INDEX = {level: idx for idx, level in enumerate(PRIORITY_LEVELS)}
+
 # Routing rules list with conditions
 ROUTING_RULES: List[Dict[str, Any]] = [
     {
@@ -121,7 +132,7 @@ def _load_routing_config() -> Optional[Dict[str, Any]]:
     try:
         if ROUTING_CONFIG_PATH.exists():
             with open(ROUTING_CONFIG_PATH, "r") as f:
-                return yaml.safe_load(f)
+                return yaml.load(f, Loader=YamlSafeLoader)
     except Exception as e:
         logger.warning(f"Failed to load routing config from {ROUTING_CONFIG_PATH}: {e}")
     return None
@@ -159,12 +170,27 @@ class TicketRouter:
         else:
             self.teams = DEFAULT_TEAMS.copy()
 
+        # Freeze category and severity lists once so the per-route membership
+        # checks are hash lookups (copies, so DEFAULT_TEAMS is left untouched)
+        self.teams = {
+            team_name: {
+                **team_def,
+                "categories": frozenset(team_def.get("categories") or ()),
+                "severities": frozenset(team_def.get("severities") or ()),
+            }
+            for team_name, team_def in self.teams.items()
+        }
+
         # Load escalation paths
         if config and "escalation_paths" in config:
             self.escalation_paths = config["escalation_paths"]
         else:
             self.escalation_paths = DEFAULT_ESCALATION_PATHS.copy()
 
+        # Decisions are a pure function of (category, severity) for a given
+        # team configuration, so precompute every known combination
+        self._decision_table = self._build_decision_table()
+
         logger.debug(f"Loaded {len(self.teams)} team definitions for routing")
 
     def route(
@@ -188,8 +214,80 @@ class TicketRouter:
         Returns:
             RoutingDecision with team assignment and reasoning
         """
-        extracted_fields = extracted_fields or {}
+        decision = self._decision_table.get((category, severity))
+        if decision is None:
+            # Unknown category or severity: fall through to the full logic
+            decision = self._compute_decision(category, severity)
+
+        # Only the reasoning depends on the extracted fields; critical
+        # escalations use a fixed reason.
+        if extracted_fields and severity != "critical":
+            reasoning = self._build_reasoning(
+                decision.team, category, severity, extracted_fields
+            )
+            return self._copy_decision(decision, reasoning)
+
+        return self._copy_decision(decision)
+
+    @staticmethod
+    def _copy_decision(
+        decision: RoutingDecision, reasoning: Optional[str] = None
+    ) -> RoutingDecision:
+        """
+        Copy a shared routing decision with fresh lists callers may mutate.
+
+        model_copy() is shallow and would hand out the decision's
+        alternative_teams and escalation_path lists; re-validating the
+        field values builds new ones.
+
+        Args:
+            decision: Shared routing decision
+            reasoning: Replacement reasoning, or None to keep the original
+
+        Returns:
+            Independent copy of the decision
+        """
+        values = decision.__dict__
+        if reasoning is not None:
+            values = {**values, "reasoning": reasoning}
+        return RoutingDecision.model_validate(values)
 
+    def _build_decision_table(self) -> Dict[Tuple[str, str], RoutingDecision]:
+        """
+        Precompute routing decisions for every known category and severity.
+
+        Known categories are those in CATEGORY_TEAM_MAP plus any handled by
+        a configured team; known severities are those in
+        SEVERITY_PRIORITY_MAP.
+
+        Returns:
+            Dictionary mapping (category, severity) to a RoutingDecision
+        """
+        categories = set(CATEGORY_TEAM_MAP)
+        for team_def in self.teams.values():
+            categories.update(team_def["categories"])
+
+        return {
+            (category, severity): self._compute_decision(category, severity)
+            for category, severity in product(sorted(categories), SEVERITY_PRIORITY_MAP)
+        }
+
+    def _compute_decision(self, category: str, severity: str) -> RoutingDecision:
+        """
+        Compute the routing decision for a category and severity.
+
+        The result depends only on its arguments and the router's team
+        configuration, so route() looks known combinations up in a table
+        built at startup. Table entries are shared; route() hands out copies
+        with their own lists via _copy_decision().
+
+        Args:
+            category: Ticket category
+            severity: Ticket severity level
+
+        Returns:
+            RoutingDecision without extracted-field context in its reasoning
+        """
         # Step 1: Check for critical severity (escalation team)
         if severity == "critical":
             return self._build_routing_decision(
@@ -213,7 +311,7 @@ class TicketRouter:
         alternative_teams = self._find_alternative_teams(category, best_team)
 
         # Build reasoning
-        reasoning = self._build_reasoning(best_team, category, severity, extracted_fields)
+        reasoning = self._build_reasoning(best_team, category, severity, {})
 
         return RoutingDecision(
             team=best_team,
@@ -238,7 +336,7 @@ class TicketRouter:
         for team_name, team_def in self.teams.items():
             if team_name == "escalation_team":
                 continue  # Skip escalation team for category matching
-            if category in team_def.get("categories", []):
+            if category in team_def["categories"]:
                 return team_name
 
         # Fallback to category mapping
@@ -264,13 +362,12 @@ class TicketRouter:
         team_def = self.teams.get(team, {})
         modifier = team_def.get("priority_modifier", 0)
 
-        priority_levels = ["low", "normal", "high", "urgent"]
-        current_idx = priority_levels.index(priority) if priority in priority_levels else 1
+        current_idx = PRIORITY_INDEX.get(priority, 1)
 
         # Apply modifier
-        new_idx = max(0, min(len(priority_levels) - 1, current_idx + modifier))
+        new_idx = max(0, min(len(PRIORITY_LEVELS) - 1, current_idx + modifier))
 
-        return priority_levels[new_idx]
+        return PRIORITY_LEVELS[new_idx]
 
     def _find_alternative_teams(
         self,
@@ -296,7 +393,7 @@ class TicketRouter:
                 continue
 
             # Check if team handles this category
-            if category in team_def.get("categories", []):
+            if category in team_def["categories"]:
                 alternatives.append(team_name)
 
         # If no alternatives found by category, add generalist teams
@@ -340,7 +437,7 @@ class TicketRouter:
 
         # Add extracted field context
         if extracted_fields:
-            field_names = list(extracted_fields.keys())[:3]
+            field_names = list(islice(extracted_fields, 3))
             if field_names:
                 parts.append(f"and detected fields: {', '.join(field_names)}")
 
@@ -395,7 +492,7 @@ class TicketRouter:
 
         # Boost for clear category-team mapping
         for team_def in self.teams.values():
-            if category in team_def.get("categories", []):
+            if category in team_def["categories"]:
                 base_confidence += 0.1
                 break
 
@@ -439,6 +536,21 @@ class TicketRouter:
         return list(self.teams.keys())
 
 
+@lru_cache()
+def _default_router() -> TicketRouter:
+    """
+    Get the shared TicketRouter with the default team configuration.
+
+    Uses lru_cache so the routing config is loaded and the decision table
+    built only once. route() hands out copies of the table entries, so
+    sharing the router is safe.
+
+    Returns:
+        TicketRouter: Cached router instance
+    """
+    return TicketRouter()
+
+
 def route_ticket(
     subject: str,
     body: str,
@@ -459,8 +571,7 @@ def route_ticket(
     Returns:
         RoutingDecision
     """
-    router = TicketRouter()
-    return router.route(
+    return _default_router().route(
         subject=subject,
         body=body,
         category=category,
@@ -7,11 +7,18 @@ including sanitization for prompt injection prevention.
 
 import logging
 import re
-from typing import List, Optional, Tuple
+from functools import lru_cache
+from itertools import islice
+from typing import Any, Dict, Iterator, List, Optional, Tuple
 from dataclasses import dataclass, field
 
 from app.schemas.ticket import TicketInput
 
+try:
+    import ahocorasick
+except ImportError:  # pragma: no cover - optional accelerator
+    ahocorasick = None
+
 logger = logging.getLogger(__name__)
 
 # Patterns that might indicate prompt injection attempts
@@ -30,12 +37,45 @@ PROMPT_INJECTION_PATTERNS = [
     r"\[INST\]",
 ]
 
+# Lowercase keyword that every match of an injection pattern must contain.
+# A pattern's regex only runs when its keyword occurs in the casefolded text;
+# patterns without an entry are always scanned. Keywords avoid the letter "i",
+# which IGNORECASE also matches against the Turkish dotted and dotless i that
+# casefold() keeps distinct.
+INJECTION_PATTERN_KEYWORDS = {
+    r"ignore\s+(all\s+)?previous\s+instructions": "gnore",
+    r"ignore\s+(all\s+)?prior\s+instructions": "gnore",
+    r"disregard\s+(all\s+)?previous": "sregard",
+    r"you\s+are\s+now\s+a?": "now",
+    r"act\s+as\s+(if\s+)?you\s+are": "act",
+    r"pretend\s+(to\s+be|you\s+are)": "pretend",
+    r"your\s+new\s+role": "role",
+    r"override\s+(previous\s+)?(instructions|rules)": "overr",
+    r"system\s*:\s*": "system",
+    r"<\|.*?\|>": "<|",
+}
+
+# Injection patterns that are plain literals, mapped to their lowercase text.
+# These are matched with a single Aho-Corasick automaton (or substring search
+# when pyahocorasick is not installed) instead of one regex scan each.
+LITERAL_INJECTION_MARKERS = {
+    r"\[SYSTEM\]": "[system]",
+    r"\[INST\]": "[inst]",
+}
+
+# Translation table deleting control characters during sanitization
+# (U+0000-U+0008, U+000B, U+000C, U+000E-U+001F, U+007F-U+009F; newlines,
+# carriage returns and tabs are kept)
+CONTROL_CHARS_TABLE = dict.fromkeys(
+    [*range(0x00, 0x09), 0x0B, 0x0C, *range(0x0E, 0x20), *range(0x7F, 0xA0)]
+)
+
 # Maximum allowed text lengths
 MAX_SUBJECT_LENGTH = 500
 MAX_BODY_LENGTH = 50000
 
 
-@dataclass
+@dataclass(slots=True)
 class ValidationResult:
     """
     Result of input validation.
@@ -54,6 +94,45 @@ class ValidationResult:
     sanitized_subject: Optional[str] = None
     sanitized_body: Optional[str] = None
 
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Convert the result to a plain dictionary.
+
+        Built by hand rather than with dataclasses.asdict, which deep-copies
+        every field. The values are JSON-native, so any encoder (json,
+        orjson) can serialize them directly.
+
+        Returns:
+            Dictionary representation of the validation result
+        """
+        return {
+            "is_valid": self.is_valid,
+            "errors": list(self.errors),
+            "warnings": list(self.warnings),
+            "sanitized_subject": self.sanitized_subject,
+            "sanitized_body": self.sanitized_body,
+        }
+
+
+def _build_literal_automaton(markers: Dict[str, str]) -> Optional[Any]:
+    """
+    Build an Aho-Corasick automaton over literal injection markers.
+
+    Args:
+        markers: Mapping of pattern to lowercase literal text
+
+    Returns:
+        Automaton instance, or None if pyahocorasick is not installed
+    """
+    if ahocorasick is None:
+        return None
+
+    automaton = ahocorasick.Automaton()
+    for pattern, literal in markers.items():
+        automaton.add_word(literal, pattern)
+    automaton.make_automaton()
+    return automaton
+
 
 class InputValidator:
     """
@@ -78,8 +157,11 @@ class InputValidator:
         self.max_subject_length = max_subject_length
         self.max_body_length = max_body_length
         self._injection_patterns = [
-            re.compile(pattern, re.IGNORECASE) for pattern in PROMPT_INJECTION_PATTERNS
+            (re.compile(pattern, re.IGNORECASE), INJECTION_PATTERN_KEYWORDS.get(pattern))
+            for pattern in PROMPT_INJECTION_PATTERNS
+            if pattern not in LITERAL_INJECTION_MARKERS
         ]
+        self._literal_automaton = _build_literal_automaton(LITERAL_INJECTION_MARKERS)
 
     def validate(self, ticket: TicketInput) -> ValidationResult:
         """
@@ -89,7 +171,9 @@ class InputValidator:
             ticket: Ticket input to validate
 
         Returns:
-            ValidationResult with validation status and any errors/warnings
+            ValidationResult with validation status and any errors/warnings.
+            Sanitized text and injection warnings are only populated when
+            the ticket is valid.
         """
         result = ValidationResult()
 
@@ -113,6 +197,11 @@ class InputValidator:
                 f"Body exceeds maximum length of {self.max_body_length}"
             )
 
+        # Invalid tickets are rejected outright, so skip the scan and
+        # sanitization whose output would be discarded
+        if not result.is_valid:
+            return result
+
         # Check for prompt injection patterns
         injection_warnings = self._check_injection_patterns(
             ticket.subject, ticket.body
@@ -129,9 +218,23 @@ class InputValidator:
 
         return result
 
-    def _check_injection_patterns(
-        self, subject: str, body: str
-    ) -> List[str]:
+    def validate_many(self, tickets: List[TicketInput]) -> List[ValidationResult]:
+        """
+        Validate a batch of tickets, e.g. for bulk imports or backfills.
+
+        All tickets share this validator's compiled patterns and literal
+        automaton, so nothing is rebuilt per ticket.
+
+        Args:
+            tickets: Ticket inputs to validate
+
+        Returns:
+            List of ValidationResult, in the same order as tickets
+        """
+        validate = self.validate
+        return [validate(ticket) for ticket in tickets]
+
+    def _check_injection_patterns(self, subject: str, body: str) -> List[str]:
         """
         Check for potential prompt injection patterns.
 
@@ -140,16 +243,79 @@ class InputValidator:
             body: Ticket body
 
         Returns:
-            List of warning messages about detected patterns
+            List of warning messages about detected patterns, one per
+            matching pattern
         """
-        warnings = []
-        combined_text = f"{subject} {body}"
+        return [
+            f"Potential prompt injection pattern detected: {pattern}"
+            for pattern in self._iter_injection_matches(f"{subject or ''} {body or ''}")
+        ]
+
+    def _has_injection_pattern(self, subject: str, body: str) -> bool:
+        """
+        Check whether any prompt injection pattern matches.
 
-        for pattern in self._injection_patterns:
-            if pattern.search(combined_text):
-                warnings.append(f"Potential prompt injection pattern detected: {pattern.pattern}")
+        For callers that only need a yes/no answer: scanning stops at the
+        first detected pattern and no warning strings are built.
 
-        return warnings
+        Args:
+            subject: Ticket subject
+            body: Ticket body
+
+        Returns:
+            True if at least one injection pattern matches
+        """
+        matches = self._iter_injection_matches(f"{subject or ''} {body or ''}")
+        return any(True for _ in islice(matches, 1))
+
+    def _iter_injection_matches(self, text: str) -> Iterator[str]:
+        """
+        Lazily yield injection patterns found in the text.
+
+        Callers pass subject and body joined into one string, as they
+        reach the LLM, so a pattern split across the two (e.g. subject
+        "please ignore all", body "previous instructions") is still
+        found. A pattern's regex is skipped when its required keyword is
+        absent, so legitimate tickets mostly cost a few substring searches.
+
+        Args:
+            text: Combined subject and body text
+
+        Yields:
+            Matched pattern strings, each at most once, in declaration order
+        """
+        # casefold() rather than lower() so keywords agree with IGNORECASE
+        # matching of characters such as U+017F (long s)
+        folded = text.casefold()
+
+        for pattern, keyword in self._injection_patterns:
+            if keyword is not None and keyword not in folded:
+                continue
+            if pattern.search(text):
+                yield pattern.pattern
+
+        yield from self._find_literal_markers(folded)
+
+    def _find_literal_markers(self, text: str) -> List[str]:
+        """
+        Find literal injection markers in the text.
+
+        Args:
+            text: Casefolded text to scan
+
+        Returns:
+            List of matched marker patterns, in declaration order
+        """
+        if self._literal_automaton is not None:
+            found = {pattern for _, pattern in self._literal_automaton.iter(text)}
+        else:
+            found = {
+                pattern
+                for pattern, literal in LITERAL_INJECTION_MARKERS.items()
+                if literal in text
+            }
+
+        return [pattern for pattern in LITERAL_INJECTION_MARKERS if pattern in found]
 
     def _sanitize_text(self, text: str) -> str:
         """
@@ -165,12 +331,11 @@ class InputValidator:
             return ""
 
         # Remove control characters except newlines and tabs
-        sanitized = re.sub(r"[\x00-\x08\x0b\x0c\x0e-\x1f\x7f-\x9f]", "", text)
-
-        # Normalize whitespace
-        sanitized = re.sub(r"\s+", " ", sanitized).strip()
+        sanitized = text.translate(CONTROL_CHARS_TABLE)
 
-        return sanitized
+        # Collapse whitespace runs and strip the ends in a single C-level pass
+        # (str.split() splits on exactly the characters matched by \s)
+        return " ".join(sanitized.split())
 
     def validate_and_sanitize(
         self, ticket: TicketInput
@@ -200,6 +365,20 @@ class InputValidator:
         return True, sanitized_ticket, result.warnings
 
 
+@lru_cache()
+def _default_validator() -> InputValidator:
+    """
+    Get the shared InputValidator with default limits.
+
+    Uses lru_cache so the injection patterns are compiled only once. The
+    validator holds no per-request state, so sharing it is safe.
+
+    Returns:
+        InputValidator: Cached validator instance
+    """
+    return InputValidator()
+
+
 def validate_ticket(ticket: TicketInput) -> ValidationResult:
     """
     Convenience function to validate a ticket.
@@ -210,5 +389,17 @@ def validate_ticket(ticket: TicketInput) -> ValidationResult:
     Returns:
         ValidationResult
     """
-    validator = InputValidator()
-    return validator.validate(ticket)
+    return _default_validator().validate(ticket)
+
+
+def validate_tickets(tickets: List[TicketInput]) -> List[ValidationResult]:
+    """
+    Convenience function to validate a batch of tickets.
+
+    Args:
+        tickets: Ticket inputs to validate
+
+    Returns:
+        List of ValidationResult, in the same order as tickets
+    """
+    return _default_validator().validate_many(tickets)
@@ -15,6 +15,7 @@ Environment Variables:
     WORKERS: Number of worker processes (default: 1)
 """
 
+import importlib.util
 import logging
 import os
 import sys
@@ -36,6 +37,28 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 
+def get_server_implementations() -> dict:
+    """
+    Select the fastest available event loop and HTTP parser.
+
+    uvloop replaces the default asyncio loop and httptools replaces the
+    pure-Python h11 parser. uvloop does not support Windows, and either
+    package may be missing from minimal installs, so each one is only
+    selected when it can be imported.
+
+    Returns:
+        Keyword arguments for uvicorn.run (may be empty)
+    """
+    options = {}
+
+    if sys.platform != "win32" and importlib.util.find_spec("uvloop"):
+        options["loop"] = "uvloop"
+    if importlib.util.find_spec("httptools"):
+        options["http"] = "httptools"
+
+    return options
+
+
 def main():
     """
     Run the FastAPI application using Uvicorn.
@@ -60,6 +83,12 @@ def main():
     logger.info(f"Workers: {workers}")
     logger.info(f"AI enabled: {settings.is_ai_enabled}")
 
+    server_implementations = get_server_implementations()
+    logger.info(
+        f"Event loop: {server_implementations.get('loop', 'asyncio')}, "
+        f"HTTP parser: {server_implementations.get('http', 'h11')}"
+    )
+
     # Run Uvicorn server
     uvicorn.run(
         "app.main:app",
@@ -70,6 +99,7 @@ def main():
         log_level=settings.LOG_LEVEL.lower(),
         access_log=True,
         use_colors=True,
+        **server_implementations,
     )
 
 
@@ -4,187 +4,141 @@ Comprehensive API Test Script for Support Ticket AI Workflow
 Generates a detailed test report with all endpoints, payloads, and responses.
 """
 
+import argparse
+import asyncio
+import hashlib
 import httpx
+import importlib.util
 import json
+import os
+import statistics
+import sys
 import time
 from datetime import datetime
-from typing import Any, Dict, List, Optional
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, TextIO, Tuple
+
+import yaml
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import uvloop
+except ImportError:
+    uvloop = None
+
+try:
+    from yaml import CSafeLoader as YamlSafeLoader
+except ImportError:
+    from yaml import SafeLoader as YamlSafeLoader
 
 # Configuration
 BASE_URL = "http://localhost:8000"
 REPORT_FILE = "test_results/api_test_report.md"
+CACHE_DIR = Path("test_results/cache")
+
+# Maximum number of test requests in flight at once. Kept small so an
+# LLM-backed backend is not flooded (or rate limited by its provider);
+# reported timings are measured under this much concurrency.
+MAX_CONCURRENCY = 4
+
+# Offer HTTP/2 when the h2 package is installed (httpx[http2]). It is only
+# negotiated over TLS, e.g. behind a reverse proxy; plain http:// against
+# Uvicorn stays on HTTP/1.1.
+HTTP2 = importlib.util.find_spec("h2") is not None
+
+# Requests sent once before the measured run to absorb cold-start costs
+# (connection setup, lazy imports, first LLM call). Reported separately and
+# excluded from the summary statistics.
+WARMUP_CASES = [
+    {
+        "name": "Warmup - Health Check",
+        "method": "GET",
+        "endpoint": "/health",
+        "payload": None
+    },
+    {
+        "name": "Warmup - Classify",
+        "method": "POST",
+        "endpoint": "/api/v1/workflow/classify",
+        "payload": {"subject": "Warmup", "body": "Warmup request"}
+    }
+]
+
+# Test case definitions, grouped by category
+CASES_FILE = Path(__file__).parent / "tests" / "fixtures" / "api_cases.yaml"
+
+
+def iter_cases() -> Iterator[Tuple[str, Dict[str, Any]]]:
+    """Yield (category, test_case) pairs from CASES_FILE in file order."""
+    with open(CASES_FILE, "r", encoding="utf-8") as f:
+        cases = yaml.load(f, Loader=YamlSafeLoader)
+
+    for category, tests in cases.items():
+        for test in tests:
+            yield category, test
+
+
+def to_report_json(data: Any) -> str:
+    """Indented JSON for the report, using orjson's C serializer when available."""
+    if orjson is not None:
+        try:
+            return orjson.dumps(data, option=orjson.OPT_INDENT_2, default=str).decode()
+        except TypeError:
+            # orjson rejects e.g. non-string keys and oversized ints
+            pass
+    return json.dumps(data, indent=2, default=str)
 
-# Test cases
-TEST_CASES = {
-    "health": [
-        {
-            "name": "Health Check",
-            "method": "GET",
-            "endpoint": "/health",
-            "payload": None
-        }
-    ],
-    "info": [
-        {
-            "name": "API Root Information",
-            "method": "GET",
-            "endpoint": "/",
-            "payload": None
-        }
-    ],
-    "workflow_full": [
-        {
-            "name": "Technical Issue - Application Crash",
-            "method": "POST",
-            "endpoint": "/api/v1/workflow/process",
-            "payload": {
-                "ticket": {
-                    "subject": "Application crashes on startup",
-                    "body": "Hi, I have been trying to launch the application but it keeps crashing. I get an error code ERR-5003 every time. My order ID is ORD-12345. This is urgent!",
-                    "customer_email": "john.doe@example.com"
-                }
-            }
-        },
-        {
-            "name": "Billing Issue - Double Charge",
-            "method": "POST",
-            "endpoint": "/api/v1/workflow/process",
-            "payload": {
-                "ticket": {
-                    "subject": "Double charged for subscription",
-                    "body": "Hello, I was charged twice this month for my Pro subscription. The amounts are $29.99 on January 15th and again on January 20th. My order IDs are ORD-111 and ORD-112. Please refund the duplicate. My email is sarah@test.com.",
-                    "customer_email": "sarah@test.com"
-                }
-            }
-        },
-        {
-            "name": "Account Issue - Login Problem",
-            "method": "POST",
-            "endpoint": "/api/v1/workflow/process",
-            "payload": {
-                "ticket": {
-                    "subject": "Cannot login to my account",
-                    "body": "I have been trying to login for the past hour but keep getting an error saying invalid credentials. I am sure my password is correct. Can you help me reset or verify my account?",
-                    "customer_email": "locked.user@company.org"
-                }
-            }
-        },
-        {
-            "name": "Feature Request - Dark Mode",
-            "method": "POST",
-            "endpoint": "/api/v1/workflow/process",
-            "payload": {
-                "ticket": {
-                    "subject": "Request for dark mode feature",
-                    "body": "Hi there! I love using your application. Would it be possible to add a dark mode option? It would be great for late night work sessions. Keep up the good work!",
-                    "customer_email": "happy.user@email.com"
-                }
-            }
-        },
-        {
-            "name": "Critical Issue - Production Down",
-            "method": "POST",
-            "endpoint": "/api/v1/workflow/process",
-            "payload": {
-                "ticket": {
-                    "subject": "URGENT: Production system down",
-                    "body": "EMERGENCY!!! Our entire production system is down and we have detected data loss. This is affecting all 500+ users. Customers cannot access their accounts. Revenue is being lost every minute. Error: 0xDEADBEEF. Need immediate assistance!!! Contact: 555-123-4567",
-                    "customer_email": "admin@enterprise-corp.com",
-                    "metadata": {"tier": "enterprise", "source": "phone_escalation"}
-                }
-            }
-        }
-    ],
-    "workflow_classify": [
-        {
-            "name": "Classify Bug Report",
-            "method": "POST",
-            "endpoint": "/api/v1/workflow/classify",
-            "payload": {
-                "subject": "Bug in export feature",
-                "body": "When I try to export my report to PDF, the application freezes. This happens every time without fail. Error message shows ERR-EXP-001."
-            }
-        }
-    ],
-    "workflow_extract": [
-        {
-            "name": "Extract Fields from Order Ticket",
-            "method": "POST",
-            "endpoint": "/api/v1/workflow/extract",
-            "payload": {
-                "subject": "Order ORD-789012 never arrived",
-                "body": "My order #ORD-789012 was supposed to arrive on 2024-01-15 but I still haven't received it. You can reach me at waiting.customer@email.com or 555-987-6543. The order was for $149.99.",
-                "category": "billing"
-            }
-        }
-    ],
-    "workflow_respond": [
-        {
-            "name": "Generate Response for Technical Issue",
-            "method": "POST",
-            "endpoint": "/api/v1/workflow/respond",
-            "payload": {
-                "subject": "Need help with installation",
-                "body": "I downloaded the software but can't figure out how to install it. The instructions aren't clear.",
-                "category": "technical",
-                "severity": "medium",
-                "extracted_fields": {"fields": []},
-                "tone": "friendly"
-            }
-        }
-    ],
-    "workflow_route": [
-        {
-            "name": "Route Critical Billing Issue",
-            "method": "POST",
-            "endpoint": "/api/v1/workflow/route",
-            "payload": {
-                "subject": "Critical payment failure",
-                "body": "Payment processing is completely down. All transactions failing. Urgent!",
-                "category": "billing",
-                "severity": "critical",
-                "extracted_fields": {"fields": []}
-            }
-        }
-    ],
-    "edge_cases": [
-        {
-            "name": "Minimal Ticket Content",
-            "method": "POST",
-            "endpoint": "/api/v1/workflow/process",
-            "payload": {
-                "ticket": {
-                    "subject": "Help",
-                    "body": "?"
-                }
-            }
-        },
-        {
-            "name": "Unicode and Special Characters",
-            "method": "POST",
-            "endpoint": "/api/v1/workflow/process",
-            "payload": {
-                "ticket": {
-                    "subject": "Problème avec l'application 🚨",
-                    "body": "Hola! Tengo un problema. L'application ne fonctionne pas! Error: ERR-ÜNİCÖDÉ. Email: test@例え.jp"
-                }
-            }
-        }
-    ]
-}
+
+def is_cacheable(test_case: Dict[str, Any]) -> bool:
+    """Whether a test case may be served from the cache.
+
+    GET cases are health and info probes: cheap, and only meaningful when
+    they reach the live server, so they always run.
+    """
+    return test_case["method"] != "GET"
+
+
+def cache_path(test_case: Dict[str, Any], base_url: str) -> Path:
+    """Content-addressed cache file for a test case's server, method, endpoint and payload."""
+    payload = json.dumps(test_case.get("payload"), sort_keys=True, separators=(",", ":"))
+    key = hashlib.sha256(f"{base_url}\n{payload}".encode()).hexdigest()
+    endpoint = test_case["endpoint"].strip("/").replace("/", "_") or "root"
+    return CACHE_DIR / f"{test_case['method'].lower()}_{endpoint}_{key}.json"
 
 
 class TestRunner:
-    def __init__(self, base_url: str):
+    def __init__(self, base_url: str, use_cache: bool = False, refresh_cache: bool = False):
         self.base_url = base_url
+        # Reuse stored responses for unchanged requests; refreshing re-runs
+        # every request and overwrites the stored responses
+        self.use_cache = use_cache or refresh_cache
+        self.refresh_cache = refresh_cache
         self.results: List[Dict[str, Any]] = []
+        self.warmup_results: List[Dict[str, Any]] = []
         self.passed = 0
         self.failed = 0
+        self.cached = 0
         self.total_time = 0
-
-    def run_test(self, test_case: Dict[str, Any]) -> Dict[str, Any]:
-        """Run a single test case."""
+        self.avg_time = 0
+        self.p50_time = 0
+        self.p95_time = 0
+        self.wall_time = 0
+
+    async def run_test(
+        self,
+        client: httpx.AsyncClient,
+        category: str,
+        test_case: Dict[str, Any],
+        warmup: bool = False,
+    ) -> Dict[str, Any]:
+        """Run a single test case (warmup and GET requests never use the cache)."""
+        use_cache = self.use_cache and not warmup and is_cacheable(test_case)
         result = {
+            "category": category,
             "name": test_case["name"],
             "method": test_case["method"],
             "endpoint": test_case["endpoint"],
@@ -193,22 +147,31 @@ class TestRunner:
             "response": None,
             "response_time": None,
             "success": False,
-            "error": None
+            "error": None,
+            "cached": False,
+            "warmup": warmup
         }
 
+        path = cache_path(test_case, self.base_url)
+        if use_cache and not self.refresh_cache and path.exists():
+            # Replayed, not re-run: counted as cached rather than passed
+            cached = json.loads(path.read_text())
+            result["status_code"] = cached["status_code"]
+            result["response"] = cached["response"]
+            result["response_time"] = 0.0
+            result["cached"] = True
+            return result
+
         try:
-            url = f"{self.base_url}{test_case['endpoint']}"
             start_time = time.time()
 
-            with httpx.Client(timeout=120.0) as client:
-                if test_case["method"] == "GET":
-                    response = client.get(url)
-                else:
-                    response = client.post(
-                        url,
-                        json=test_case.get("payload"),
-                        headers={"Content-Type": "application/json"}
-                    )
+            if test_case["method"] == "GET":
+                response = await client.get(test_case["endpoint"])
+            else:
+                response = await client.post(
+                    test_case["endpoint"],
+                    json=test_case.get("payload")
+                )
 
             end_time = time.time()
             result["response_time"] = round(end_time - start_time, 3)
@@ -216,111 +179,214 @@ class TestRunner:
             result["success"] = 200 <= response.status_code < 300
 
             try:
-                result["response"] = response.json()
-            except:
+                # Parse the raw bytes once, in C when orjson is available
+                if orjson is not None:
+                    result["response"] = orjson.loads(response.content)
+                else:
+                    result["response"] = response.json()
+            except ValueError:
                 result["response"] = response.text
 
-            if result["success"]:
-                self.passed += 1
-            else:
-                self.failed += 1
-
-            self.total_time += result["response_time"]
+            if use_cache and result["success"]:
+                path.parent.mkdir(parents=True, exist_ok=True)
+                path.write_text(json.dumps({
+                    "status_code": result["status_code"],
+                    "response": result["response"],
+                }))
 
         except Exception as e:
             result["error"] = str(e)
             result["success"] = False
-            self.failed += 1
 
-        self.results.append(result)
         return result
 
-    def run_all(self) -> None:
-        """Run all test cases."""
+    def compute_stats(self) -> None:
+        """Aggregate pass/fail counts and response-time statistics over all results."""
+        # Cached results made no request, so they carry no timing information
+        times = [
+            r["response_time"] for r in self.results
+            if r["response_time"] is not None and not r["cached"]
+        ]
+
+        self.cached = sum(1 for r in self.results if r["cached"])
+        self.passed = sum(1 for r in self.results if r["success"])
+        self.failed = len(self.results) - self.passed - self.cached
+        self.total_time = sum(times)
+        self.avg_time = statistics.fmean(times) if times else 0
+        self.p50_time = statistics.median(times) if times else 0
+        # quantiles() needs at least two data points
+        self.p95_time = statistics.quantiles(times, n=20)[-1] if len(times) > 1 else self.p50_time
+
+    async def run_all(self, client: httpx.AsyncClient) -> None:
+        """Run all test cases, at most MAX_CONCURRENCY at a time."""
+        print("Warming up...")
+        for test in WARMUP_CASES:
+            self.warmup_results.append(
+                await self.run_test(client, "warmup", test, warmup=True)
+            )
+
         print("Running API tests...")
-        for category, tests in TEST_CASES.items():
-            print(f"  Testing {category}...")
-            for test in tests:
-                self.run_test(test)
-                status = "✓" if self.results[-1]["success"] else "✗"
-                print(f"    {status} {test['name']}")
-
-    def generate_report(self) -> str:
-        """Generate markdown test report."""
-        report = []
-        report.append("# Support Ticket AI Workflow - API Test Report\n")
-        report.append(f"**Generated:** {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
-        report.append(f"**Base URL:** `{self.base_url}`\n")
-        report.append(f"**LLM Provider:** OpenRouter (anthropic/claude-3.5-sonnet)\n\n")
+        start_time = time.time()
+        semaphore = asyncio.Semaphore(MAX_CONCURRENCY)
+
+        async def run_limited(category: str, test: Dict[str, Any]) -> Dict[str, Any]:
+            # Acquired before run_test starts its clock, so time spent
+            # waiting for a slot is not counted as response time
+            async with semaphore:
+                return await self.run_test(client, category, test)
+
+        tasks = [
+            asyncio.create_task(run_limited(category, test))
+            for category, test in iter_cases()
+        ]
+        results = await asyncio.gather(*tasks)
+        self.wall_time = round(time.time() - start_time, 3)
+
+        # Results come back in file order; totals are computed once
+        self.results = list(results)
+        self.compute_stats()
+
+        category = None
+        for result in self.results:
+            if result["category"] != category:
+                category = result["category"]
+                print(f"  Testing {category}...")
+            status = "↺" if result["cached"] else "✓" if result["success"] else "✗"
+            print(f"    {status} {result['name']}")
+
+    def generate_report(self, sink: TextIO, generated_at: Optional[datetime] = None) -> None:
+        """Write the markdown test report to sink."""
+        generated_at = generated_at or datetime.now()
+        sink.write("# Support Ticket AI Workflow - API Test Report\n")
+        sink.write(f"**Generated:** {generated_at:%Y-%m-%d %H:%M:%S}\n")
+        sink.write(f"**Base URL:** `{self.base_url}`\n")
+        sink.write(f"**LLM Provider:** OpenRouter (anthropic/claude-3.5-sonnet)\n\n")
 
         # Summary
-        report.append("## Test Summary\n\n")
-        total = self.passed + self.failed
-        pass_rate = (self.passed / total * 100) if total > 0 else 0
-        report.append(f"| Metric | Value |\n")
-        report.append(f"|--------|-------|\n")
-        report.append(f"| Total Tests | {total} |\n")
-        report.append(f"| Passed | {self.passed} |\n")
-        report.append(f"| Failed | {self.failed} |\n")
-        report.append(f"| Pass Rate | {pass_rate:.1f}% |\n")
-        report.append(f"| Total Time | {self.total_time:.2f}s |\n")
-        report.append(f"| Avg Response Time | {self.total_time/total:.2f}s |\n\n")
+        sink.write("## Test Summary\n\n")
+        # Cached results were not re-run, so the pass rate covers live runs only
+        live = self.passed + self.failed
+        pass_rate = (self.passed / live * 100) if live > 0 else 0
+        sink.write(f"| Metric | Value |\n")
+        sink.write(f"|--------|-------|\n")
+        sink.write(f"| Total Tests | {live + self.cached} |\n")
+        sink.write(f"| Passed | {self.passed} |\n")
+        sink.write(f"| Failed | {self.failed} |\n")
+        sink.write(f"| Cached (not re-run) | {self.cached} |\n")
+        sink.write(f"| Pass Rate (live) | {pass_rate:.1f}% |\n")
+        sink.write(f"| Concurrency | up to {MAX_CONCURRENCY} requests |\n")
+        sink.write(f"| Total Time | {self.total_time:.2f}s |\n")
+        sink.write(f"| Wall Time | {self.wall_time:.2f}s |\n")
+        sink.write(f"| Avg Response Time | {self.avg_time:.2f}s |\n")
+        sink.write(f"| P50 Response Time | {self.p50_time:.2f}s |\n")
+        sink.write(f"| P95 Response Time | {self.p95_time:.2f}s |\n\n")
+        sink.write(
+            f"Response times were measured with up to {MAX_CONCURRENCY} requests "
+            "in flight, so they are not directly comparable with sequential runs.\n\n"
+        )
 
         # Detailed Results
-        report.append("---\n\n")
-        report.append("## Detailed Test Results\n\n")
+        sink.write("---\n\n")
+        sink.write("## Detailed Test Results\n\n")
 
-        for category, tests in TEST_CASES.items():
-            report.append(f"### {category.replace('_', ' ').title()}\n\n")
+        # Group results by category in a single pass, keeping file order
+        categories: Dict[str, List[Dict[str, Any]]] = {}
+        for result in self.results:
+            categories.setdefault(result["category"], []).append(result)
 
-            for test in tests:
-                # Find result
-                result = next((r for r in self.results if r["name"] == test["name"]), None)
-                if not result:
-                    continue
+        for category, results in categories.items():
+            sink.write(f"### {category.replace('_', ' ').title()}\n\n")
 
-                status_emoji = "✅" if result["success"] else "❌"
-                report.append(f"#### {status_emoji} {result['name']}\n\n")
+            for result in results:
+                status_emoji = "♻️" if result["cached"] else "✅" if result["success"] else "❌"
+                sink.write(f"#### {status_emoji} {result['name']}\n\n")
 
                 # Request
-                report.append("**Request:**\n\n")
-                report.append(f"```http\n{result['method']} {result['endpoint']}\n")
+                sink.write("**Request:**\n\n")
+                sink.write(f"```http\n{result['method']} {result['endpoint']}\n")
                 if result["payload"]:
-                    report.append(f"\n{json.dumps(result['payload'], indent=2)}\n")
-                report.append("```\n\n")
+                    sink.write("\n")
+                    sink.write(to_report_json(result["payload"]))
+                    sink.write("\n")
+                sink.write("```\n\n")
 
                 # Response info
-                report.append("**Response:**\n\n")
-                report.append(f"- Status Code: `{result['status_code']}`\n")
-                report.append(f"- Response Time: `{result['response_time']}s`\n")
+                sink.write("**Response:**\n\n")
+                sink.write(f"- Status Code: `{result['status_code']}`\n")
+                sink.write(f"- Response Time: `{result['response_time']}s`\n")
+                if result["cached"]:
+                    sink.write("- Served from cache\n")
                 if result["error"]:
-                    report.append(f"- Error: `{result['error']}`\n")
-                report.append("\n")
+                    sink.write(f"- Error: `{result['error']}`\n")
+                sink.write("\n")
 
                 # Response body
-                report.append("```json\n")
+                sink.write("```json\n")
                 if result["response"]:
-                    report.append(json.dumps(result["response"], indent=2, default=str))
-                report.append("\n```\n\n")
-                report.append("---\n\n")
-
-        return "".join(report)
-
-
-def main():
-    runner = TestRunner(BASE_URL)
-    runner.run_all()
-    report = runner.generate_report()
-
-    # Save report
-    with open(REPORT_FILE, "w") as f:
-        f.write(report)
+                    sink.write(to_report_json(result["response"]))
+                sink.write("\n```\n\n")
+                sink.write("---\n\n")
+
+        # Warmup requests, shown for transparency only
+        if self.warmup_results:
+            sink.write("## Warmup\n\n")
+            sink.write("| Request | Status Code | Response Time |\n")
+            sink.write("|---------|-------------|---------------|\n")
+            for result in self.warmup_results:
+                sink.write(
+                    f"| {result['method']} {result['endpoint']} "
+                    f"| `{result['status_code']}` | `{result['response_time']}s` |\n"
+                )
+            sink.write("\n")
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Run the API test suite and write a report.")
+    parser.add_argument(
+        "--use-cache",
+        action="store_true",
+        help=f"reuse stored responses for unchanged requests (stored in {CACHE_DIR})",
+    )
+    parser.add_argument(
+        "--refresh-cache",
+        action="store_true",
+        help="re-run every request and overwrite the stored responses",
+    )
+    return parser.parse_args()
+
+
+async def main(use_cache: bool = False, refresh_cache: bool = False):
+    started_at = datetime.now()
+    async with httpx.AsyncClient(
+        base_url=BASE_URL,
+        timeout=120.0,
+        headers={"Content-Type": "application/json"},
+        http2=HTTP2,
+        limits=httpx.Limits(
+            max_connections=MAX_CONCURRENCY, max_keepalive_connections=MAX_CONCURRENCY
+        ),
+    ) as client:
+        runner = TestRunner(BASE_URL, use_cache=use_cache, refresh_cache=refresh_cache)
+        await runner.run_all(client)
+
+    # Save report, streaming it into a temporary file and swapping it in
+    # atomically so an interrupted run leaves the previous report intact
+    os.makedirs(os.path.dirname(REPORT_FILE), exist_ok=True)
+    tmp_file = f"{REPORT_FILE}.tmp"
+    with open(tmp_file, "w", encoding="utf-8", buffering=1 << 20) as f:
+        runner.generate_report(f, generated_at=started_at)
+    os.replace(tmp_file, REPORT_FILE)
 
     print(f"\nTest report saved to: {REPORT_FILE}")
     print(f"Passed: {runner.passed}/{runner.passed + runner.failed}")
+    if runner.cached:
+        print(f"Cached (not re-run): {runner.cached}")
 
     return runner
 
 
 if __name__ == "__main__":
-    main()
+    args = parse_args()
+    # uvloop is a faster drop-in event loop; it does not support Windows
+    run = uvloop.run if uvloop is not None and sys.platform != "win32" else asyncio.run
+    run(main(use_cache=args.use_cache, refresh_cache=args.refresh_cache))
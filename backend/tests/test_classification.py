@@ -9,10 +9,13 @@ This module tests the TicketClassifier class, including:
 - Keyword matching
 """
 
+import json
+from pathlib import Path
+
 import pytest
-from unittest.mock import AsyncMock, MagicMock, patch
 
 from app.schemas import ClassificationResult
+from app.services.workflow import classifiers
 from app.services.workflow.classifiers import (
     TicketClassifier,
     VALID_CATEGORIES,
@@ -21,6 +24,19 @@ from app.services.workflow.classifiers import (
     SEVERITY_INDICATORS,
 )
 
+# Keyword lookups used by the assertions, built once at import
+TECHNICAL_KEYWORDS = frozenset(CATEGORY_KEYWORDS.get("technical", []))
+
+# Sample tickets checked one test per ticket (so pytest-xdist can spread
+# them across workers); the special-case tickets are covered elsewhere
+SAMPLE_TICKET_IDS = tuple(
+    ticket_id
+    for ticket_id in json.loads(
+        (Path(__file__).parent / "fixtures" / "sample_tickets.json").read_text()
+    )["tickets"]
+    if ticket_id not in ("malicious_input", "duplicate_content")
+)
+
 
 # ============================================================================
 # Category Classification Tests
@@ -30,107 +46,98 @@ from app.services.workflow.classifiers import (
 class TestCategoryClassification:
     """Tests for category classification."""
 
-    @pytest.mark.asyncio
-    async def test_classify_technical_ticket(self, ticket_classifier):
+    def test_classify_technical_ticket(self, ticket_classifier):
         """Test classification of a technical support ticket."""
-        result = await ticket_classifier.classify(
+        result = ticket_classifier.classify_sync(
             subject="API returning 500 errors",
             body="Our system is experiencing errors when calling the API. "
                  "The bug is causing crashes in production.",
-            use_ai=False,
         )
 
         assert result.category == "technical"
         assert result.category_confidence > 0.5
         assert "error" in result.keywords_matched or "bug" in result.keywords_matched
 
-    @pytest.mark.asyncio
-    async def test_classify_billing_ticket(self, ticket_classifier):
-        """Test classification of a billing support ticket."""
-        result = await ticket_classifier.classify(
-            subject="Refund request for my subscription",
-            body="I was charged for a payment I didn't authorize. "
-                 "I need a refund for the invoice sent last week.",
-            use_ai=False,
-        )
-
-        assert result.category == "billing"
-        assert result.category_confidence > 0.5
-
-    @pytest.mark.asyncio
-    async def test_classify_account_ticket(self, ticket_classifier):
-        """Test classification of an account support ticket."""
-        result = await ticket_classifier.classify(
-            subject="Cannot login to my account",
-            body="I've been trying to sign in but my password doesn't work. "
-                 "I think my credentials are wrong or my account is locked.",
-            use_ai=False,
-        )
-
-        assert result.category == "account"
-        assert result.category_confidence > 0.5
-
-    @pytest.mark.asyncio
-    async def test_classify_feature_request_ticket(self, ticket_classifier):
-        """Test classification of a feature request ticket."""
-        result = await ticket_classifier.classify(
-            subject="Feature suggestion: Add dark mode",
-            body="I would like to request a new feature for the application. "
-                 "My wish is to have a dark mode option for better UX.",
-            use_ai=False,
-        )
-
-        assert result.category == "feature_request"
-        assert result.category_confidence > 0.5
-
-    @pytest.mark.asyncio
-    async def test_classify_bug_report_ticket(self, ticket_classifier):
-        """Test classification of a bug report ticket."""
-        result = await ticket_classifier.classify(
-            subject="Bug: Application crashes on startup",
-            body="I found a defect in the application. It's showing incorrect "
-                 "behavior and unexpected results when I try to use it.",
-            use_ai=False,
+    @pytest.mark.parametrize(
+        "subject, body, expected_category, min_confidence",
+        [
+            (
+                "Refund request for my subscription",
+                "I was charged for a payment I didn't authorize. "
+                "I need a refund for the invoice sent last week.",
+                "billing",
+                0.5,
+            ),
+            (
+                "Cannot login to my account",
+                "I've been trying to sign in but my password doesn't work. "
+                "I think my credentials are wrong or my account is locked.",
+                "account",
+                0.5,
+            ),
+            (
+                "Feature suggestion: Add dark mode",
+                "I would like to request a new feature for the application. "
+                "My wish is to have a dark mode option for better UX.",
+                "feature_request",
+                0.5,
+            ),
+            (
+                "Bug: Application crashes on startup",
+                "I found a defect in the application. It's showing incorrect "
+                "behavior and unexpected results when I try to use it.",
+                "bug_report",
+                0.5,
+            ),
+            # General is the fallback category, so its confidence may be low
+            (
+                "Hello, I have a question",
+                "Hi there! I'm wondering how to get started with your service. "
+                "Can you help me with some information?",
+                "general",
+                None,
+            ),
+        ],
+        ids=["billing", "account", "feature_request", "bug_report", "general"],
+    )
+    def test_classify_category(
+        self, ticket_classifier, subject, body, expected_category, min_confidence
+    ):
+        """Test rule-based classification of a ticket for each category."""
+        result = ticket_classifier.classify_sync(
+            subject=subject,
+            body=body,
+        )
+
+        assert result.category == expected_category
+        if min_confidence is not None:
+            assert result.category_confidence > min_confidence
+
+    @pytest.mark.parametrize(
+        "ticket_by_kind, expected_category",
+        [
+            ("technical_high", "technical"),
+            ("billing_medium", "billing"),
+            ("account_medium", "account"),
+            ("feature_request_low", "feature_request"),
+            ("bug_report_medium", "bug_report"),
+            ("general_low", "general"),
+        ],
+        indirect=["ticket_by_kind"],
+    )
+    def test_classify_sample_ticket(
+        self, ticket_classifier, ticket_by_kind, expected_category
+    ):
+        """Test classification of the sample ticket for each category."""
+        result = ticket_classifier.classify_sync(
+            subject=ticket_by_kind["subject"],
+            body=ticket_by_kind["body"],
         )
 
-        assert result.category == "bug_report"
-        assert result.category_confidence > 0.5
-
-    @pytest.mark.asyncio
-    async def test_classify_general_ticket(self, ticket_classifier):
-        """Test classification of a general inquiry ticket."""
-        result = await ticket_classifier.classify(
-            subject="Hello, I have a question",
-            body="Hi there! I'm wondering how to get started with your service. "
-                 "Can you help me with some information?",
-            use_ai=False,
+        assert result.category == expected_category, (
+            f"Expected {expected_category}, got {result.category} for ticket: {ticket_by_kind['subject']}"
         )
 
-        assert result.category == "general"
-        # General might have lower confidence since it's a fallback
-
-    @pytest.mark.asyncio
-    async def test_classify_all_categories(self, ticket_classifier, sample_tickets):
-        """Test classification across all ticket categories."""
-        category_tickets = {
-            "technical": sample_tickets["technical_high"],
-            "billing": sample_tickets["billing_medium"],
-            "account": sample_tickets["account_medium"],
-            "feature_request": sample_tickets["feature_request_low"],
-            "bug_report": sample_tickets["bug_report_medium"],
-            "general": sample_tickets["general_low"],
-        }
-
-        for expected_category, ticket_data in category_tickets.items():
-            result = await ticket_classifier.classify(
-                subject=ticket_data["subject"],
-                body=ticket_data["body"],
-                use_ai=False,
-            )
-            assert result.category == expected_category, (
-                f"Expected {expected_category}, got {result.category} for ticket: {ticket_data['subject']}"
-            )
-
 
 # ============================================================================
 # Severity Classification Tests
@@ -140,64 +147,64 @@ class TestCategoryClassification:
 class TestSeverityClassification:
     """Tests for severity classification."""
 
-    @pytest.mark.asyncio
-    async def test_classify_critical_severity(self, ticket_classifier):
-        """Test classification of critical severity tickets."""
-        result = await ticket_classifier.classify(
+    @pytest.mark.parametrize(
+        "subject, body, expected_severities",
+        [
+            (
+                "URGENT: Production system down!",
+                "This is an emergency! Our production environment is completely down. "
+                "We need this resolved ASAP. This is a critical situation.",
+                {"critical"},
+            ),
+            (
+                "Important issue affecting users",
+                "This is a serious problem that's affecting multiple users. "
+                "We need a resolution quickly as it's high priority.",
+                {"critical", "high"},
+            ),
+            # Medium should be default or matched
+            (
+                "Issue with feature",
+                "I'm having a problem with one of the features. "
+                "It's an issue but not urgent. Please help when possible.",
+                {"medium", "high", "low"},
+            ),
+            (
+                "Minor cosmetic issue",
+                "I noticed a small visual glitch. It's a minor suggestion - "
+                "no rush to fix this. Just curious if you could look at it sometime.",
+                {"low"},
+            ),
+        ],
+        ids=["critical", "high", "medium", "low"],
+    )
+    def test_classify_severity(
+        self, ticket_classifier, subject, body, expected_severities
+    ):
+        """Test rule-based severity classification for each level."""
+        result = ticket_classifier.classify_sync(
+            subject=subject,
+            body=body,
+        )
+
+        assert result.severity in expected_severities
+
+    def test_critical_severity_reports_urgency(self, ticket_classifier):
+        """Test that critical tickets carry confidence and urgency indicators."""
+        result = ticket_classifier.classify_sync(
             subject="URGENT: Production system down!",
             body="This is an emergency! Our production environment is completely down. "
                  "We need this resolved ASAP. This is a critical situation.",
-            use_ai=False,
         )
 
-        assert result.severity == "critical"
         assert result.severity_confidence > 0.4
         assert len(result.urgency_indicators) > 0
 
-    @pytest.mark.asyncio
-    async def test_classify_high_severity(self, ticket_classifier):
-        """Test classification of high severity tickets."""
-        result = await ticket_classifier.classify(
-            subject="Important issue affecting users",
-            body="This is a serious problem that's affecting multiple users. "
-                 "We need a resolution quickly as it's high priority.",
-            use_ai=False,
-        )
-
-        assert result.severity in ["critical", "high"]
-
-    @pytest.mark.asyncio
-    async def test_classify_medium_severity(self, ticket_classifier):
-        """Test classification of medium severity tickets."""
-        result = await ticket_classifier.classify(
-            subject="Issue with feature",
-            body="I'm having a problem with one of the features. "
-                 "It's an issue but not urgent. Please help when possible.",
-            use_ai=False,
-        )
-
-        # Medium should be default or matched
-        assert result.severity in ["medium", "high", "low"]
-
-    @pytest.mark.asyncio
-    async def test_classify_low_severity(self, ticket_classifier):
-        """Test classification of low severity tickets."""
-        result = await ticket_classifier.classify(
-            subject="Minor cosmetic issue",
-            body="I noticed a small visual glitch. It's a minor suggestion - "
-                 "no rush to fix this. Just curious if you could look at it sometime.",
-            use_ai=False,
-        )
-
-        assert result.severity == "low"
-
-    @pytest.mark.asyncio
-    async def test_critical_ticket_from_samples(self, ticket_classifier, critical_ticket):
+    def test_critical_ticket_from_samples(self, ticket_classifier, critical_ticket):
         """Test critical severity classification from sample data."""
-        result = await ticket_classifier.classify(
+        result = ticket_classifier.classify_sync(
             subject=critical_ticket["subject"],
             body=critical_ticket["body"],
-            use_ai=False,
         )
 
         assert result.severity == "critical"
@@ -211,39 +218,33 @@ class TestSeverityClassification:
 class TestConfidenceScores:
     """Tests for confidence score calculations."""
 
-    @pytest.mark.asyncio
-    async def test_confidence_in_valid_range(self, ticket_classifier):
+    def test_confidence_in_valid_range(self, ticket_classifier):
         """Test that confidence scores are within valid range [0, 1]."""
-        result = await ticket_classifier.classify(
+        result = ticket_classifier.classify_sync(
             subject="Test ticket",
             body="This is a test ticket with error and bug keywords.",
-            use_ai=False,
         )
 
         assert 0.0 <= result.category_confidence <= 1.0
         assert 0.0 <= result.severity_confidence <= 1.0
 
-    @pytest.mark.asyncio
-    async def test_high_confidence_for_clear_match(self, ticket_classifier):
+    def test_high_confidence_for_clear_match(self, ticket_classifier):
         """Test that clear keyword matches produce high confidence."""
-        result = await ticket_classifier.classify(
+        result = ticket_classifier.classify_sync(
             subject="Refund for overcharged billing",
             body="I was overcharged on my bill and need a refund for the payment. "
                  "The invoice is incorrect and I want my money back for the subscription.",
-            use_ai=False,
         )
 
         # Multiple billing keywords should give higher confidence
         assert result.category == "billing"
         assert result.category_confidence >= 0.6
 
-    @pytest.mark.asyncio
-    async def test_lower_confidence_for_ambiguous_ticket(self, ticket_classifier):
+    def test_lower_confidence_for_ambiguous_ticket(self, ticket_classifier):
         """Test that ambiguous tickets have lower confidence."""
-        result = await ticket_classifier.classify(
+        result = ticket_classifier.classify_sync(
             subject="Help needed",
             body="Can you assist me?",
-            use_ai=False,
         )
 
         # Minimal content should result in lower confidence or general category
@@ -260,9 +261,9 @@ class TestFallbackClassification:
     """Tests for fallback classification behavior."""
 
     @pytest.mark.asyncio
-    async def test_fallback_when_ai_disabled(self, mock_ai_service):
+    async def test_fallback_when_ai_disabled(self, stub_classifier_ai, classifier_factory):
         """Test that rule-based fallback is used when AI is disabled."""
-        classifier = TicketClassifier(ai_service=mock_ai_service, enable_ai=False)
+        classifier = classifier_factory(ai_service=stub_classifier_ai, enable_ai=False)
 
         result = await classifier.classify(
             subject="I need a refund for my subscription",
@@ -271,14 +272,44 @@ class TestFallbackClassification:
         )
 
         # Should not have called AI service
-        mock_ai_service.classify_ticket.assert_not_called()
+        assert stub_classifier_ai.calls == 0
         assert result.category == "billing"
 
+    def test_repeated_ticket_uses_cached_rules(self):
+        """Test repeated tickets reuse the rule-based result as a fresh copy."""
+        classifier = TicketClassifier(enable_ai=False)
+
+        first = classifier.classify_sync("Refund", "Wrong invoice charge")
+        first.keywords_matched.append("mutated")
+        second = classifier.classify_sync("Refund", "Wrong invoice charge")
+
+        assert len(classifier._rule_cache) == 1
+        assert second is not first
+        assert second.category == "billing"
+        assert second.keywords_matched == classifier._classify_with_rules(
+            "Refund", "Wrong invoice charge"
+        ).keywords_matched
+
+    def test_rule_cache_keeps_digests_not_text(self, monkeypatch):
+        """Test the rule cache is keyed by digest and evicts past its size."""
+        monkeypatch.setattr(classifiers, "RULE_CACHE_SIZE", 2)
+        classifier = TicketClassifier(enable_ai=False)
+        bodies = ["alice@example.com", "bob@example.com", "carol@example.com"]
+
+        for body in bodies:
+            classifier.classify_sync("Refund", body)
+
+        assert list(classifier._rule_cache) == [
+            classifiers._rule_cache_key("Refund", body) for body in bodies[1:]
+        ]
+        assert all(len(key) == 16 for key in classifier._rule_cache)
+        assert classifiers._rule_cache_key("ab", "c") != classifiers._rule_cache_key("a", "bc")
+
     @pytest.mark.asyncio
-    async def test_fallback_when_ai_fails(self, mock_ai_service):
+    async def test_fallback_when_ai_fails(self, stub_classifier_ai, classifier_factory):
         """Test that fallback is used when AI service fails."""
-        mock_ai_service.classify_ticket.side_effect = Exception("AI service error")
-        classifier = TicketClassifier(ai_service=mock_ai_service, enable_ai=True)
+        stub_classifier_ai.result = Exception("AI service error")
+        classifier = classifier_factory(ai_service=stub_classifier_ai, enable_ai=True)
 
         result = await classifier.classify(
             subject="I need a refund",
@@ -291,7 +322,7 @@ class TestFallbackClassification:
         assert result.category in VALID_CATEGORIES
 
     @pytest.mark.asyncio
-    async def test_fallback_when_confidence_below_threshold(self, mock_ai_service):
+    async def test_fallback_when_confidence_below_threshold(self, stub_classifier_ai, classifier_factory):
         """Test fallback when AI confidence is below threshold."""
         low_confidence_result = ClassificationResult(
             category="technical",
@@ -301,10 +332,10 @@ class TestFallbackClassification:
             secondary_categories=[],
             reasoning="Low confidence AI result",
         )
-        mock_ai_service.classify_ticket.return_value = low_confidence_result
+        stub_classifier_ai.result = low_confidence_result
 
-        classifier = TicketClassifier(
-            ai_service=mock_ai_service,
+        classifier = classifier_factory(
+            ai_service=stub_classifier_ai,
             enable_ai=True,
             confidence_threshold=0.6,
         )
@@ -320,9 +351,9 @@ class TestFallbackClassification:
         assert result.category in VALID_CATEGORIES
 
     @pytest.mark.asyncio
-    async def test_no_ai_service_fallback(self):
+    async def test_no_ai_service_fallback(self, classifier_factory):
         """Test fallback when no AI service is provided."""
-        classifier = TicketClassifier(ai_service=None, enable_ai=True)
+        classifier = classifier_factory(ai_service=None, enable_ai=True)
 
         result = await classifier.classify(
             subject="I need help with my account",
@@ -342,28 +373,24 @@ class TestFallbackClassification:
 class TestSecondaryCategories:
     """Tests for secondary category detection."""
 
-    @pytest.mark.asyncio
-    async def test_secondary_categories_detected(self, ticket_classifier):
+    def test_secondary_categories_detected(self, ticket_classifier):
         """Test that secondary categories are detected for multi-topic tickets."""
-        result = await ticket_classifier.classify(
+        result = ticket_classifier.classify_sync(
             subject="Login error causing billing issues",
             body="I can't login to my account and I'm also having billing problems "
                  "with my subscription payment and there's an error in the system.",
-            use_ai=False,
         )
 
         # Should have primary category with possible secondary
         assert result.category in VALID_CATEGORIES
         # Secondary categories may or may not be detected depending on keyword count
 
-    @pytest.mark.asyncio
-    async def test_max_two_secondary_categories(self, ticket_classifier):
+    def test_max_two_secondary_categories(self, ticket_classifier):
         """Test that at most 2 secondary categories are returned."""
-        result = await ticket_classifier.classify(
+        result = ticket_classifier.classify_sync(
             subject="Multiple issues across system",
             body="Login error billing payment refund subscription account "
                  "password crash bug feature request enhancement suggestion.",
-            use_ai=False,
         )
 
         assert len(result.secondary_categories) <= 2
@@ -377,32 +404,52 @@ class TestSecondaryCategories:
 class TestKeywordMatching:
     """Tests for keyword matching functionality."""
 
-    @pytest.mark.asyncio
-    async def test_keywords_matched_returned(self, ticket_classifier):
+    def test_keywords_matched_returned(self, ticket_classifier):
         """Test that matched keywords are returned in result."""
-        result = await ticket_classifier.classify(
+        result = ticket_classifier.classify_sync(
             subject="System crash and error",
             body="The application is broken and not working. I found a bug.",
-            use_ai=False,
         )
 
         assert len(result.keywords_matched) > 0
         # Should contain some of the technical keywords
-        technical_keywords = set(CATEGORY_KEYWORDS.get("technical", []))
-        matched_set = set(kw.lower() for kw in result.keywords_matched)
-        assert matched_set.intersection(technical_keywords)
+        matched_set = frozenset(map(str.lower, result.keywords_matched))
+        assert matched_set & TECHNICAL_KEYWORDS
 
-    @pytest.mark.asyncio
-    async def test_urgency_indicators_returned(self, ticket_classifier):
+    def test_urgency_indicators_returned(self, ticket_classifier):
         """Test that urgency indicators are returned in result."""
-        result = await ticket_classifier.classify(
+        result = ticket_classifier.classify_sync(
             subject="URGENT issue",
             body="This is critical and needs ASAP attention!",
-            use_ai=False,
         )
 
         assert len(result.urgency_indicators) > 0
 
+    def test_keywords_match_whole_words_only(self, ticket_classifier):
+        """Test that keywords inside longer words are not matched."""
+        found = ticket_classifier._find_keywords("errors_found, re-error and bugfix")
+
+        assert "error" in found
+        assert "bug" not in found
+
+    @pytest.mark.parametrize(
+        "subject, body",
+        [
+            ("System crash and error", "The application is broken and not working."),
+            ("URGENT: refund", "Payment failed twice, please help ASAP!"),
+            ("Hello", "Just curious about a minor feature idea, no rush."),
+        ],
+    )
+    def test_matches_without_automaton(self, ticket_classifier, monkeypatch, subject, body):
+        """Test that the regex fallback classifies like the automaton."""
+        monkeypatch.setattr(classifiers, "ahocorasick", None)
+        fallback_classifier = TicketClassifier(enable_ai=False)
+
+        assert fallback_classifier._keyword_automaton is None
+        assert fallback_classifier._classify_with_rules(subject, body) == (
+            ticket_classifier._classify_with_rules(subject, body)
+        )
+
 
 # ============================================================================
 # Validation Tests
@@ -443,25 +490,21 @@ class TestCategoryValidation:
 class TestReasoning:
     """Tests for classification reasoning."""
 
-    @pytest.mark.asyncio
-    async def test_reasoning_provided(self, ticket_classifier):
+    def test_reasoning_provided(self, ticket_classifier):
         """Test that reasoning is provided in classification result."""
-        result = await ticket_classifier.classify(
+        result = ticket_classifier.classify_sync(
             subject="API error",
             body="Getting an error when calling the API. This is urgent.",
-            use_ai=False,
         )
 
         assert result.reasoning is not None
         assert len(result.reasoning) > 0
 
-    @pytest.mark.asyncio
-    async def test_reasoning_includes_keywords(self, ticket_classifier):
+    def test_reasoning_includes_keywords(self, ticket_classifier):
         """Test that reasoning includes matched keywords."""
-        result = await ticket_classifier.classify(
+        result = ticket_classifier.classify_sync(
             subject="Billing refund request",
             body="I need a refund for the overcharged payment.",
-            use_ai=False,
         )
 
         assert result.reasoning is not None
@@ -477,66 +520,79 @@ class TestReasoning:
 class TestEdgeCases:
     """Tests for edge cases in classification."""
 
-    @pytest.mark.asyncio
-    async def test_empty_subject(self, ticket_classifier):
+    def test_empty_subject(self, ticket_classifier):
         """Test classification with empty subject."""
-        result = await ticket_classifier.classify(
+        result = ticket_classifier.classify_sync(
             subject="",
             body="I'm having a problem with my billing and need a refund.",
-            use_ai=False,
         )
 
         assert result.category in VALID_CATEGORIES
 
-    @pytest.mark.asyncio
-    async def test_empty_body(self, ticket_classifier):
+    def test_empty_body(self, ticket_classifier):
         """Test classification with empty body."""
-        result = await ticket_classifier.classify(
+        result = ticket_classifier.classify_sync(
             subject="Billing refund payment issue",
             body="",
-            use_ai=False,
         )
 
         assert result.category in VALID_CATEGORIES
 
-    @pytest.mark.asyncio
-    async def test_very_long_text(self, ticket_classifier):
+    def test_very_long_text(self, ticket_classifier):
         """Test classification with very long text."""
         long_text = "error " * 1000  # Very long text with error keyword
 
-        result = await ticket_classifier.classify(
+        result = ticket_classifier.classify_sync(
             subject="Technical issue",
             body=long_text,
-            use_ai=False,
         )
 
         assert result.category == "technical"
 
-    @pytest.mark.asyncio
-    async def test_special_characters(self, ticket_classifier):
+    def test_max_scan_chars_limits_rule_scan(self):
+        """Test that keywords past max_scan_chars are ignored."""
+        body = "error " * 1000 + "refund invoice payment"
+        classifier = TicketClassifier(enable_ai=False, max_scan_chars=4096)
+
+        capped = classifier.classify_sync("Ticket", body)
+        full = TicketClassifier(enable_ai=False).classify_sync("Ticket", body)
+
+        assert capped.category == "technical"
+        assert full.category == "billing"
+
+    @pytest.mark.parametrize(
+        "text, limit, expected",
+        [
+            ("pay my billing now", 12, "pay my "),
+            ("pay my bill now", 11, "pay my bill"),
+            ("short", 10, "short"),
+            ("unbroken", 4, ""),
+        ],
+    )
+    def test_truncation_keeps_whole_words(self, text, limit, expected):
+        """Test that truncation never leaves a partial word at the end."""
+        assert classifiers._truncate_at_word_boundary(text, limit) == expected
+
+    def test_special_characters(self, ticket_classifier):
         """Test classification with special characters."""
-        result = await ticket_classifier.classify(
+        result = ticket_classifier.classify_sync(
             subject="!!!URGENT!!! Billing $$$ issue ###",
             body="I need a @refund for my $payment!!! This is #critical.",
-            use_ai=False,
         )
 
         assert result.category in VALID_CATEGORIES
         assert result.severity in VALID_SEVERITIES
 
-    @pytest.mark.asyncio
-    async def test_case_insensitive_matching(self, ticket_classifier):
+    def test_case_insensitive_matching(self, ticket_classifier):
         """Test that keyword matching is case insensitive."""
-        result_lower = await ticket_classifier.classify(
+        result_lower = ticket_classifier.classify_sync(
             subject="error in system",
             body="there is an error in the system",
-            use_ai=False,
         )
 
-        result_upper = await ticket_classifier.classify(
+        result_upper = ticket_classifier.classify_sync(
             subject="ERROR IN SYSTEM",
             body="THERE IS AN ERROR IN THE SYSTEM",
-            use_ai=False,
         )
 
         assert result_lower.category == result_upper.category
@@ -551,7 +607,7 @@ class TestAIClassification:
     """Tests for AI-based classification."""
 
     @pytest.mark.asyncio
-    async def test_ai_classification_used_when_enabled(self, mock_ai_service):
+    async def test_ai_classification_used_when_enabled(self, stub_classifier_ai, classifier_factory):
         """Test that AI classification is used when enabled."""
         expected_result = ClassificationResult(
             category="technical",
@@ -561,23 +617,23 @@ class TestAIClassification:
             secondary_categories=["bug_report"],
             reasoning="AI detected technical issue",
         )
-        mock_ai_service.classify_ticket.return_value = expected_result
+        stub_classifier_ai.result = expected_result
 
-        classifier = TicketClassifier(ai_service=mock_ai_service, enable_ai=True)
+        classifier = classifier_factory(ai_service=stub_classifier_ai, enable_ai=True)
         result = await classifier.classify(
             subject="Test",
             body="Test",
             use_ai=True,
         )
 
-        mock_ai_service.classify_ticket.assert_called_once()
+        assert stub_classifier_ai.calls == 1
         assert result.category == "technical"
         assert result.category_confidence == 0.95
 
     @pytest.mark.asyncio
-    async def test_ai_override_use_ai_false(self, mock_ai_service):
+    async def test_ai_override_use_ai_false(self, stub_classifier_ai, classifier_factory):
         """Test that use_ai=False overrides enable_ai setting."""
-        classifier = TicketClassifier(ai_service=mock_ai_service, enable_ai=True)
+        classifier = classifier_factory(ai_service=stub_classifier_ai, enable_ai=True)
 
         result = await classifier.classify(
             subject="Billing refund",
@@ -585,9 +641,28 @@ class TestAIClassification:
             use_ai=False,  # Override to not use AI
         )
 
-        mock_ai_service.classify_ticket.assert_not_called()
+        assert stub_classifier_ai.calls == 0
         assert result.category == "billing"  # Should use rule-based
 
+    @pytest.mark.asyncio
+    async def test_classify_many_uses_ai_per_ticket(self, stub_classifier_ai, classifier_factory):
+        """Test that batch classification calls the AI once per ticket, in order."""
+        stub_classifier_ai.queued = [
+            ClassificationResult(
+                category=category,
+                category_confidence=0.95,
+                severity="low",
+                severity_confidence=0.9,
+            )
+            for category in ("billing", "account")
+        ]
+        classifier = classifier_factory(ai_service=stub_classifier_ai, enable_ai=True)
+
+        results = await classifier.classify_many([("A", "a"), ("B", "b")])
+
+        assert stub_classifier_ai.calls == 2
+        assert [result.category for result in results] == ["billing", "account"]
+
 
 # ============================================================================
 # Integration Tests with Sample Tickets
@@ -597,27 +672,32 @@ class TestAIClassification:
 class TestSampleTicketsClassification:
     """Tests using sample tickets from fixtures."""
 
+    @pytest.mark.parametrize("ticket_id", SAMPLE_TICKET_IDS)
+    def test_sample_ticket_classifies_correctly(
+        self, ticket_classifier, sample_tickets, ticket_id
+    ):
+        """Test that a sample ticket classifies to its expected category and severity."""
+        ticket_data = sample_tickets[ticket_id]
+
+        result = ticket_classifier.classify_sync(ticket_data["subject"], ticket_data["body"])
+
+        if ticket_data.get("expected_category"):
+            assert result.category == ticket_data["expected_category"]
+        if ticket_data.get("expected_severity"):
+            assert result.severity == ticket_data["expected_severity"]
+        assert result.category_confidence >= 0.3
+        assert result.severity_confidence >= 0.3
+
     @pytest.mark.asyncio
-    async def test_all_sample_tickets_classify_correctly(
-        self, ticket_classifier, sample_tickets, assert_classification
+    async def test_classify_many_matches_single_classification(
+        self, ticket_classifier, sample_tickets
     ):
-        """Test that all sample tickets classify to expected categories."""
-        for ticket_id, ticket_data in sample_tickets.items():
-            if ticket_id in ["malicious_input", "duplicate_content"]:
-                continue  # Skip special test cases
-
-            result = await ticket_classifier.classify(
-                subject=ticket_data["subject"],
-                body=ticket_data["body"],
-                use_ai=False,
-            )
+        """Test that batch rule-based classification matches per-ticket results."""
+        tickets = [
+            (sample_tickets[ticket_id]["subject"], sample_tickets[ticket_id]["body"])
+            for ticket_id in SAMPLE_TICKET_IDS
+        ]
 
-            expected_category = ticket_data.get("expected_category")
-            expected_severity = ticket_data.get("expected_severity")
+        results = await ticket_classifier.classify_many(tickets, use_ai=False)
 
-            assert_classification(
-                result,
-                expected_category=expected_category,
-                expected_severity=expected_severity,
-                min_confidence=0.3,
-            )
+        assert results == [ticket_classifier.classify_sync(*ticket) for ticket in tickets]
@@ -9,6 +9,8 @@ This module tests the FieldExtractor class, including:
 - Priority keyword extraction
 """
 
+import re
+
 import pytest
 from unittest.mock import AsyncMock, MagicMock, patch
 
@@ -30,54 +32,46 @@ from app.services.workflow.extractors import (
 class TestOrderIDExtraction:
     """Tests for order ID extraction."""
 
-    @pytest.mark.asyncio
-    async def test_extract_order_id_ord_format(self, field_extractor):
+    def test_extract_order_id_ord_format(self, field_extractor):
         """Test extraction of ORD-XXXXX format order IDs."""
-        result = await field_extractor.extract(
+        result = field_extractor.extract_sync(
             subject="Order not received",
             body="My order ORD-123456 hasn't arrived yet.",
             category="billing",
-            use_ai=False,
         )
 
         order_fields = [f for f in result.fields if f.name == "order_id"]
         assert len(order_fields) > 0
         assert "ORD-123456" in order_fields[0].value or "123456" in order_fields[0].value
 
-    @pytest.mark.asyncio
-    async def test_extract_order_id_hash_format(self, field_extractor):
+    def test_extract_order_id_hash_format(self, field_extractor):
         """Test extraction of #XXXXX format order IDs."""
-        result = await field_extractor.extract(
+        result = field_extractor.extract_sync(
             subject="Order inquiry",
             body="I have a question about order #78901.",
             category="billing",
-            use_ai=False,
         )
 
         order_fields = [f for f in result.fields if f.name == "order_id"]
         assert len(order_fields) > 0
 
-    @pytest.mark.asyncio
-    async def test_extract_order_id_order_prefix(self, field_extractor):
+    def test_extract_order_id_order_prefix(self, field_extractor):
         """Test extraction of 'order ID: XXX' format."""
-        result = await field_extractor.extract(
+        result = field_extractor.extract_sync(
             subject="Refund request",
             body="Please refund order ID: ABC123XYZ.",
             category="billing",
-            use_ai=False,
         )
 
         order_fields = [f for f in result.fields if f.name == "order_id"]
         assert len(order_fields) > 0
 
-    @pytest.mark.asyncio
-    async def test_no_order_id_when_absent(self, field_extractor):
+    def test_no_order_id_when_absent(self, field_extractor):
         """Test that no order ID is extracted when not present."""
-        result = await field_extractor.extract(
+        result = field_extractor.extract_sync(
             subject="General question",
             body="I have a question about your service.",
             category="general",
-            use_ai=False,
         )
 
         order_fields = [f for f in result.fields if f.name == "order_id"]
@@ -92,55 +86,47 @@ class TestOrderIDExtraction:
 class TestEmailExtraction:
     """Tests for email extraction."""
 
-    @pytest.mark.asyncio
-    async def test_extract_single_email(self, field_extractor):
+    def test_extract_single_email(self, field_extractor):
         """Test extraction of a single email address."""
-        result = await field_extractor.extract(
+        result = field_extractor.extract_sync(
             subject="Account issue",
             body="Please contact me at john.doe@example.com.",
             category="account",
-            use_ai=False,
         )
 
         email_fields = [f for f in result.fields if f.name == "account_email"]
         assert len(email_fields) > 0
         assert email_fields[0].value == "john.doe@example.com"
 
-    @pytest.mark.asyncio
-    async def test_extract_multiple_emails(self, field_extractor):
+    def test_extract_multiple_emails(self, field_extractor):
         """Test extraction of multiple email addresses."""
-        result = await field_extractor.extract(
+        result = field_extractor.extract_sync(
             subject="Contact info",
             body="My emails are user1@test.com and user2@test.org.",
             category="general",
-            use_ai=False,
         )
 
         email_fields = [f for f in result.fields if f.name == "account_email"]
         assert len(email_fields) >= 2
 
-    @pytest.mark.asyncio
-    async def test_email_normalized_to_lowercase(self, field_extractor):
+    def test_email_normalized_to_lowercase(self, field_extractor):
         """Test that extracted emails are normalized to lowercase."""
-        result = await field_extractor.extract(
+        result = field_extractor.extract_sync(
             subject="Contact",
             body="Email me at JOHN.DOE@EXAMPLE.COM.",
             category="general",
-            use_ai=False,
         )
 
         email_fields = [f for f in result.fields if f.name == "account_email"]
         assert len(email_fields) > 0
         assert email_fields[0].value == email_fields[0].value.lower()
 
-    @pytest.mark.asyncio
-    async def test_complex_email_formats(self, field_extractor):
+    def test_complex_email_formats(self, field_extractor):
         """Test extraction of complex email formats."""
-        result = await field_extractor.extract(
+        result = field_extractor.extract_sync(
             subject="Contact",
             body="Reach me at user.name+tag@subdomain.example.co.uk.",
             category="general",
-            use_ai=False,
         )
 
         email_fields = [f for f in result.fields if f.name == "account_email"]
@@ -155,53 +141,45 @@ class TestEmailExtraction:
 class TestPhoneNumberExtraction:
     """Tests for phone number extraction."""
 
-    @pytest.mark.asyncio
-    async def test_extract_us_phone_format(self, field_extractor):
+    def test_extract_us_phone_format(self, field_extractor):
         """Test extraction of US phone number format."""
-        result = await field_extractor.extract(
+        result = field_extractor.extract_sync(
             subject="Call me",
             body="My phone number is 555-123-4567.",
             category="general",
-            use_ai=False,
         )
 
         phone_fields = [f for f in result.fields if f.name == "phone_number"]
         assert len(phone_fields) > 0
 
-    @pytest.mark.asyncio
-    async def test_extract_phone_with_parentheses(self, field_extractor):
+    def test_extract_phone_with_parentheses(self, field_extractor):
         """Test extraction of phone number with parentheses."""
-        result = await field_extractor.extract(
+        result = field_extractor.extract_sync(
             subject="Contact info",
             body="Call me at (555) 123-4567.",
             category="general",
-            use_ai=False,
         )
 
         phone_fields = [f for f in result.fields if f.name == "phone_number"]
         assert len(phone_fields) > 0
 
-    @pytest.mark.asyncio
-    async def test_extract_international_phone(self, field_extractor):
+    def test_extract_international_phone(self, field_extractor):
         """Test extraction of international phone number."""
-        result = await field_extractor.extract(
+        result = field_extractor.extract_sync(
             subject="International contact",
             body="My number is +44 20 7946 0958.",
             category="general",
-            use_ai=False,
         )
 
         phone_fields = [f for f in result.fields if f.name == "phone_number"]
         assert len(phone_fields) > 0
 
-    @pytest.mark.asyncio
-    async def test_extract_phone_with_country_code(self, field_extractor):
+    def test_extract_phone_with_country_code(self, field_extractor):
         """Test extraction of phone with +1 country code."""
-        result = await field_extractor.extract(
+        result = field_extractor.extract_sync(
             subject="Contact",
             body="Reach me at +1-555-987-6543.",
             category="general",
-            use_ai=False,
         )
 
         phone_fields = [f for f in result.fields if f.name == "phone_number"]
@@ -216,54 +194,46 @@ class TestPhoneNumberExtraction:
 class TestErrorCodeExtraction:
     """Tests for error code extraction."""
 
-    @pytest.mark.asyncio
-    async def test_extract_err_format(self, field_extractor):
+    def test_extract_err_format(self, field_extractor):
         """Test extraction of ERR-XXXX format error codes."""
-        result = await field_extractor.extract(
+        result = field_extractor.extract_sync(
             subject="Error message",
             body="I'm getting error code ERR-50023 when trying to login.",
             category="technical",
-            use_ai=False,
         )
 
         error_fields = [f for f in result.fields if f.name == "error_code"]
         assert len(error_fields) > 0
         assert "ERR-50023" in error_fields[0].value or "50023" in error_fields[0].value
 
-    @pytest.mark.asyncio
-    async def test_extract_hex_format(self, field_extractor):
+    def test_extract_hex_format(self, field_extractor):
         """Test extraction of 0xXXXX hex format error codes."""
-        result = await field_extractor.extract(
+        result = field_extractor.extract_sync(
             subject="Application crash",
             body="The app crashes with error 0xDEADBEEF.",
             category="technical",
-            use_ai=False,
         )
 
         error_fields = [f for f in result.fields if f.name == "error_code"]
         assert len(error_fields) > 0
 
-    @pytest.mark.asyncio
-    async def test_extract_generic_error_code(self, field_extractor):
+    def test_extract_generic_error_code(self, field_extractor):
         """Test extraction of generic error code patterns."""
-        result = await field_extractor.extract(
+        result = field_extractor.extract_sync(
             subject="System error",
             body="Error: SYS-404 occurred while processing.",
             category="technical",
-            use_ai=False,
         )
 
         error_fields = [f for f in result.fields if f.name == "error_code"]
         assert len(error_fields) > 0
 
-    @pytest.mark.asyncio
-    async def test_error_code_normalized_to_uppercase(self, field_extractor):
+    def test_error_code_normalized_to_uppercase(self, field_extractor):
         """Test that error codes are normalized to uppercase."""
-        result = await field_extractor.extract(
+        result = field_extractor.extract_sync(
             subject="Error",
             body="Getting error err-12345.",
             category="technical",
-            use_ai=False,
         )
 
         error_fields = [f for f in result.fields if f.name == "error_code"]
@@ -279,40 +249,34 @@ class TestErrorCodeExtraction:
 class TestAmountExtraction:
     """Tests for amount/currency extraction."""
 
-    @pytest.mark.asyncio
-    async def test_extract_dollar_amount(self, field_extractor):
+    def test_extract_dollar_amount(self, field_extractor):
         """Test extraction of dollar amounts."""
-        result = await field_extractor.extract(
+        result = field_extractor.extract_sync(
             subject="Billing issue",
             body="I was charged $29.99 instead of $19.99.",
             category="billing",
-            use_ai=False,
         )
 
         amount_fields = [f for f in result.fields if f.name == "amount"]
         assert len(amount_fields) > 0
 
-    @pytest.mark.asyncio
-    async def test_extract_large_amount(self, field_extractor):
+    def test_extract_large_amount(self, field_extractor):
         """Test extraction of large amounts with commas."""
-        result = await field_extractor.extract(
+        result = field_extractor.extract_sync(
             subject="Large charge",
             body="I see a charge of $5,000 on my statement.",
             category="billing",
-            use_ai=False,
         )
 
         amount_fields = [f for f in result.fields if f.name == "amount"]
         assert len(amount_fields) > 0
 
-    @pytest.mark.asyncio
-    async def test_extract_currency_code(self, field_extractor):
+    def test_extract_currency_code(self, field_extractor):
         """Test extraction of amounts with currency codes."""
-        result = await field_extractor.extract(
+        result = field_extractor.extract_sync(
             subject="International charge",
             body="I was charged 99.99 EUR for my subscription.",
             category="billing",
-            use_ai=False,
         )
 
         amount_fields = [f for f in result.fields if f.name == "amount"]
@@ -327,40 +291,34 @@ class TestAmountExtraction:
 class TestDateExtraction:
     """Tests for date extraction."""
 
-    @pytest.mark.asyncio
-    async def test_extract_mmddyyyy_date(self, field_extractor):
+    def test_extract_mmddyyyy_date(self, field_extractor):
         """Test extraction of MM/DD/YYYY format dates."""
-        result = await field_extractor.extract(
+        result = field_extractor.extract_sync(
             subject="Order date",
             body="I placed the order on 01/15/2024.",
             category="billing",
-            use_ai=False,
         )
 
         date_fields = [f for f in result.fields if f.name == "date"]
         assert len(date_fields) > 0
 
-    @pytest.mark.asyncio
-    async def test_extract_iso_date(self, field_extractor):
+    def test_extract_iso_date(self, field_extractor):
         """Test extraction of ISO format dates."""
-        result = await field_extractor.extract(
+        result = field_extractor.extract_sync(
             subject="Transaction date",
             body="The transaction occurred on 2024-01-15.",
             category="billing",
-            use_ai=False,
         )
 
         date_fields = [f for f in result.fields if f.name == "date"]
         assert len(date_fields) > 0
 
-    @pytest.mark.asyncio
-    async def test_extract_written_date(self, field_extractor):
+    def test_extract_written_date(self, field_extractor):
         """Test extraction of written dates."""
-        result = await field_extractor.extract(
+        result = field_extractor.extract_sync(
             subject="Event date",
             body="This happened on January 15, 2024.",
             category="general",
-            use_ai=False,
         )
 
         date_fields = [f for f in result.fields if f.name == "date"]
@@ -375,28 +333,24 @@ class TestDateExtraction:
 class TestPriorityKeywordsExtraction:
     """Tests for priority keyword extraction."""
 
-    @pytest.mark.asyncio
-    async def test_extract_urgent_keyword(self, field_extractor):
+    def test_extract_urgent_keyword(self, field_extractor):
         """Test extraction of 'urgent' keyword."""
-        result = await field_extractor.extract(
+        result = field_extractor.extract_sync(
             subject="Urgent issue",
             body="This is urgent and needs immediate attention!",
             category="technical",
-            use_ai=False,
         )
 
         priority_fields = [f for f in result.fields if f.name == "priority_keywords"]
         assert len(priority_fields) > 0
         assert "urgent" in [kw.lower() for kw in priority_fields[0].value]
 
-    @pytest.mark.asyncio
-    async def test_extract_multiple_priority_keywords(self, field_extractor):
+    def test_extract_multiple_priority_keywords(self, field_extractor):
         """Test extraction of multiple priority keywords."""
-        result = await field_extractor.extract(
+        result = field_extractor.extract_sync(
             subject="Critical emergency",
             body="This is critical! I need help ASAP. It's an emergency!",
             category="technical",
-            use_ai=False,
         )
 
         priority_fields = [f for f in result.fields if f.name == "priority_keywords"]
@@ -404,19 +358,48 @@ class TestPriorityKeywordsExtraction:
         keywords = [kw.lower() for kw in priority_fields[0].value]
         assert len(keywords) >= 2
 
-    @pytest.mark.asyncio
-    async def test_no_priority_keywords_when_absent(self, field_extractor):
+    def test_no_priority_keywords_when_absent(self, field_extractor):
         """Test that no priority keywords extracted when not present."""
-        result = await field_extractor.extract(
+        result = field_extractor.extract_sync(
             subject="General question",
             body="I have a simple question about your product.",
             category="general",
-            use_ai=False,
         )
 
         priority_fields = [f for f in result.fields if f.name == "priority_keywords"]
         assert len(priority_fields) == 0
 
+    def test_priority_keywords_match_whole_words(self, field_extractor):
+        """Test that keywords inside longer words are not reported."""
+        assert field_extractor._extract_priority_keywords("I know it's important-ish") == [
+            "important"
+        ]
+
+    @pytest.mark.parametrize(
+        "text,expected",
+        [
+            ("Please handle this urgently", ["urgent"]),
+            ("The site is critically broken", ["critical"]),
+            ("I need it sooner", ["soon"]),
+            ("Importantly, the export fails", ["important"]),
+            ("Raise the criticality", ["critical"]),
+            ("Deploy the urgent_fix branch", ["urgent"]),
+            ("I need this now", ["now"]),
+            ("I know nowhere else to ask", []),
+            ("Nowadays the acknowledgement emails are slow", []),
+            ("Raise the urgency", []),
+        ],
+    )
+    def test_priority_keyword_inflections(self, field_extractor, text, expected):
+        """Test that keywords may start longer words, except "now", but never end them."""
+        assert field_extractor._extract_priority_keywords(text) == expected
+
+    def test_overlapping_priority_keywords(self, field_extractor):
+        """Test that a keyword inside a longer keyword phrase is still reported."""
+        keywords = field_extractor._extract_priority_keywords("Reply AS SOON AS POSSIBLE")
+
+        assert keywords == ["soon", "as soon as possible"]
+
 
 # ============================================================================
 # Missing Required Fields Tests
@@ -426,40 +409,34 @@ class TestPriorityKeywordsExtraction:
 class TestMissingRequiredFields:
     """Tests for missing required fields detection."""
 
-    @pytest.mark.asyncio
-    async def test_missing_error_code_for_technical(self, field_extractor):
+    def test_missing_error_code_for_technical(self, field_extractor):
         """Test detection of missing error code for technical category."""
-        result = await field_extractor.extract(
+        result = field_extractor.extract_sync(
             subject="Technical issue",
             body="Something is broken but I don't have an error code.",
             category="technical",
-            use_ai=False,
         )
 
         # error_code is required for technical category
         assert "error_code" in result.missing_required
 
-    @pytest.mark.asyncio
-    async def test_missing_order_id_for_billing(self, field_extractor):
+    def test_missing_order_id_for_billing(self, field_extractor):
         """Test detection of missing order_id for billing category."""
-        result = await field_extractor.extract(
+        result = field_extractor.extract_sync(
             subject="Billing question",
             body="I have a question about charges but no order ID.",
             category="billing",
-            use_ai=False,
         )
 
         # order_id or amount is required for billing
         assert len(result.missing_required) > 0
 
-    @pytest.mark.asyncio
-    async def test_no_missing_when_all_provided(self, field_extractor):
+    def test_no_missing_when_all_provided(self, field_extractor):
         """Test no missing fields when all required fields are present."""
-        result = await field_extractor.extract(
+        result = field_extractor.extract_sync(
             subject="Technical error",
             body="Getting error code ERR-12345 when using the system.",
             category="technical",
-            use_ai=False,
         )
 
         # error_code should be extracted, so it shouldn't be in missing
@@ -467,14 +444,12 @@ class TestMissingRequiredFields:
         if error_fields:
             assert "error_code" not in result.missing_required
 
-    @pytest.mark.asyncio
-    async def test_no_required_fields_for_feature_request(self, field_extractor):
+    def test_no_required_fields_for_feature_request(self, field_extractor):
         """Test that feature_request has no required fields."""
-        result = await field_extractor.extract(
+        result = field_extractor.extract_sync(
             subject="Feature idea",
             body="I'd like to suggest a new feature.",
             category="feature_request",
-            use_ai=False,
         )
 
         # feature_request has no required fields
@@ -489,14 +464,12 @@ class TestMissingRequiredFields:
 class TestFieldValidation:
     """Tests for field validation."""
 
-    @pytest.mark.asyncio
-    async def test_valid_email_no_validation_error(self, field_extractor):
+    def test_valid_email_no_validation_error(self, field_extractor):
         """Test that valid email doesn't produce validation error."""
-        result = await field_extractor.extract(
+        result = field_extractor.extract_sync(
             subject="Contact",
             body="My email is valid@email.com.",
             category="general",
-            use_ai=False,
         )
 
         email_fields = [f for f in result.fields if f.name == "account_email"]
@@ -505,14 +478,12 @@ class TestFieldValidation:
             email_errors = [e for e in result.validation_errors if "account_email" in e]
             assert len(email_errors) == 0
 
-    @pytest.mark.asyncio
-    async def test_confidence_in_valid_range(self, field_extractor):
+    def test_confidence_in_valid_range(self, field_extractor):
         """Test that all confidence scores are in valid range."""
-        result = await field_extractor.extract(
+        result = field_extractor.extract_sync(
             subject="Order ORD-12345",
             body="Contact me at test@example.com or call 555-123-4567.",
             category="billing",
-            use_ai=False,
         )
 
         for field in result.fields:
@@ -529,28 +500,24 @@ class TestFieldValidation:
 class TestConfidenceScores:
     """Tests for confidence score calculations."""
 
-    @pytest.mark.asyncio
-    async def test_high_confidence_for_clear_patterns(self, field_extractor):
+    def test_high_confidence_for_clear_patterns(self, field_extractor):
         """Test that clear pattern matches have high confidence."""
-        result = await field_extractor.extract(
+        result = field_extractor.extract_sync(
             subject="Order issue",
             body="My order ORD-123456 has an error ERR-50023.",
             category="technical",
-            use_ai=False,
         )
 
         for field in result.fields:
             if field.name in ["order_id", "error_code"]:
                 assert field.confidence >= 0.7
 
-    @pytest.mark.asyncio
-    async def test_email_confidence_boost(self, field_extractor):
+    def test_email_confidence_boost(self, field_extractor):
         """Test that valid email format boosts confidence."""
-        result = await field_extractor.extract(
+        result = field_extractor.extract_sync(
             subject="Contact",
             body="Email: john.doe@example.com",
             category="general",
-            use_ai=False,
         )
 
         email_fields = [f for f in result.fields if f.name == "account_email"]
@@ -566,14 +533,12 @@ class TestConfidenceScores:
 class TestSourceSpan:
     """Tests for source span extraction."""
 
-    @pytest.mark.asyncio
-    async def test_source_span_captured(self, field_extractor):
+    def test_source_span_captured(self, field_extractor):
         """Test that source span is captured for extracted fields."""
-        result = await field_extractor.extract(
+        result = field_extractor.extract_sync(
             subject="Order",
             body="My order ID is ORD-123456.",
             category="billing",
-            use_ai=False,
         )
 
         order_fields = [f for f in result.fields if f.name == "order_id"]
@@ -581,14 +546,12 @@ class TestSourceSpan:
             assert order_fields[0].source_span is not None
             assert "ORD-123456" in order_fields[0].source_span
 
-    @pytest.mark.asyncio
-    async def test_source_span_contains_original_text(self, field_extractor):
+    def test_source_span_contains_original_text(self, field_extractor):
         """Test that source span contains the original matched text."""
-        result = await field_extractor.extract(
+        result = field_extractor.extract_sync(
             subject="Contact",
             body="Please email me at user@example.com",
             category="general",
-            use_ai=False,
         )
 
         email_fields = [f for f in result.fields if f.name == "account_email"]
@@ -620,6 +583,35 @@ class TestFallbackExtraction:
         mock_ai_service.extract_fields.assert_not_called()
         assert len(result.fields) > 0
 
+    @pytest.mark.asyncio
+    async def test_extract_without_ai_matches_extract_sync(self, mock_ai_service):
+        """Test that extract(use_ai=False) returns the synchronous result."""
+        extractor = FieldExtractor(ai_service=mock_ai_service, enable_ai=True)
+
+        result = await extractor.extract(
+            subject="Order ORD-12345 urgent",
+            body="Contact test@example.com",
+            category="billing",
+            use_ai=False,
+        )
+
+        mock_ai_service.extract_fields.assert_not_called()
+        assert result == extractor.extract_sync(
+            "Order ORD-12345 urgent", "Contact test@example.com", "billing"
+        )
+
+    @pytest.mark.asyncio
+    async def test_extract_many_uses_ai_per_ticket(self, mock_ai_service):
+        """Test that batch extraction calls the AI once per ticket."""
+        extractor = FieldExtractor(ai_service=mock_ai_service, enable_ai=True)
+
+        results = await extractor.extract_many(
+            [("Order ORD-12345", "Thanks", "billing"), ("Login", "test@example.com", None)]
+        )
+
+        assert mock_ai_service.extract_fields.await_count == 2
+        assert [result.missing_required for result in results] == [["amount"], []]
+
     @pytest.mark.asyncio
     async def test_fallback_when_ai_fails(self, mock_ai_service):
         """Test that fallback is used when AI service fails."""
@@ -688,6 +680,19 @@ class TestHelperMethods:
         assert best.confidence == 0.95
         assert best.value == "test2@test.com"
 
+    def test_get_highest_confidence_field_tie_keeps_first(self, field_extractor):
+        """Test that equal confidences resolve to the earliest field."""
+        fields = [
+            ExtractedField(name="email", value="first@test.com", confidence=0.9, source_span="a"),
+            ExtractedField(name="phone", value="555-0100", confidence=0.99, source_span="b"),
+            ExtractedField(name="email", value="second@test.com", confidence=0.9, source_span="c"),
+        ]
+
+        best = field_extractor.get_highest_confidence_field(fields, "email")
+
+        assert best is not None
+        assert best.value == "first@test.com"
+
     def test_get_highest_confidence_field_not_found(self, field_extractor):
         """Test getting highest confidence field when not found."""
         fields = [
@@ -739,16 +744,38 @@ class TestCustomPatterns:
         patterns = field_extractor.get_extraction_patterns()
         assert "custom_field" in patterns
 
-    @pytest.mark.asyncio
-    async def test_custom_pattern_extraction(self, field_extractor):
+    def test_custom_pattern_is_instance_local(self, field_extractor):
+        """Test custom patterns do not leak into other extractors."""
+        field_extractor.add_custom_pattern("order_id", r"LOCAL-(\d+)")
+
+        assert r"LOCAL-(\d+)" not in EXTRACTION_PATTERNS["order_id"]
+        assert r"LOCAL-(\d+)" not in FieldExtractor().patterns["order_id"]
+
+    def test_invalid_custom_pattern_rejected(self, field_extractor):
+        """Test an invalid custom pattern raises without being registered."""
+        with pytest.raises(re.error):
+            field_extractor.add_custom_pattern("custom_field", r"(unclosed")
+
+        assert "custom_field" not in field_extractor.get_extraction_patterns()
+
+    def test_custom_pattern_with_inline_unicode_flag(self, field_extractor):
+        """Test a pattern that sets (?u) inline is accepted and used on any text."""
+        field_extractor.add_custom_pattern("ref", r"(?u)REF-(\w+)")
+
+        ascii_result = field_extractor.extract_sync(subject="Ref", body="See REF-abc123")
+        unicode_result = field_extractor.extract_sync(subject="Ref", body="See REF-café")
+
+        assert [f.value for f in ascii_result.fields if f.name == "ref"] == ["abc123"]
+        assert [f.value for f in unicode_result.fields if f.name == "ref"] == ["café"]
+
+    def test_custom_pattern_extraction(self, field_extractor):
         """Test extraction using custom pattern."""
         field_extractor.add_custom_pattern("custom_id", r"CUSTOM-(\d+)")
 
-        result = await field_extractor.extract(
+        result = field_extractor.extract_sync(
             subject="Custom ID",
             body="My custom ID is CUSTOM-99999.",
             category="general",
-            use_ai=False,
         )
 
         custom_fields = [f for f in result.fields if f.name == "custom_id"]
@@ -763,40 +790,41 @@ class TestCustomPatterns:
 class TestEdgeCases:
     """Tests for edge cases in extraction."""
 
-    @pytest.mark.asyncio
-    async def test_empty_text(self, field_extractor):
+    def test_empty_text(self, field_extractor):
         """Test extraction with empty text."""
-        result = await field_extractor.extract(
+        result = field_extractor.extract_sync(
             subject="",
             body="",
             category="general",
-            use_ai=False,
         )
 
         assert isinstance(result, ExtractionResult)
         assert len(result.fields) == 0
 
-    @pytest.mark.asyncio
-    async def test_no_matching_patterns(self, field_extractor):
+    def test_empty_text_reports_missing_required(self, field_extractor):
+        """Test that empty text still lists the category's required fields."""
+        result = field_extractor.extract_sync(subject="", body="", category="billing")
+
+        assert result.fields == []
+        assert result.missing_required == ["order_id", "amount"]
+
+    def test_no_matching_patterns(self, field_extractor):
         """Test extraction when no patterns match."""
-        result = await field_extractor.extract(
+        result = field_extractor.extract_sync(
             subject="Hello",
             body="Just saying hello!",
             category="general",
-            use_ai=False,
         )
 
         assert isinstance(result, ExtractionResult)
         # No extractable fields in this text
 
-    @pytest.mark.asyncio
-    async def test_duplicate_values_filtered(self, field_extractor):
+    def test_duplicate_values_filtered(self, field_extractor):
         """Test that duplicate values are filtered out."""
-        result = await field_extractor.extract(
+        result = field_extractor.extract_sync(
             subject="Contact",
             body="Email: test@test.com. Also reach me at test@test.com.",
             category="general",
-            use_ai=False,
         )
 
         email_fields = [f for f in result.fields if f.name == "account_email"]
@@ -804,14 +832,12 @@ class TestEdgeCases:
         values = [f.value for f in email_fields]
         assert values.count("test@test.com") <= 1
 
-    @pytest.mark.asyncio
-    async def test_special_characters_in_text(self, field_extractor):
+    def test_special_characters_in_text(self, field_extractor):
         """Test extraction with special characters."""
-        result = await field_extractor.extract(
+        result = field_extractor.extract_sync(
             subject="Issue!!!",
             body="Error @#$% ERR-12345 !!! Call 555-123-4567 NOW!!!",
             category="technical",
-            use_ai=False,
         )
 
         # Should still extract the error code and phone despite special chars
@@ -819,6 +845,18 @@ class TestEdgeCases:
         phone_fields = [f for f in result.fields if f.name == "phone_number"]
         assert len(error_fields) > 0 or len(phone_fields) > 0
 
+    @pytest.mark.parametrize(
+        "text",
+        ["order\x1cABC12345", "Bestellung für order ABC12345"],
+        ids=["unicode-space", "non-ascii"],
+    )
+    def test_ascii_fast_path_matches_unicode_mode(self, field_extractor, text):
+        """Test the ASCII fast path never changes which fields are found."""
+        fields = field_extractor._extract_with_regex(text)
+
+        order_ids = [f.value for f in fields if f.name == "order_id"]
+        assert order_ids == ["ABC12345"]
+
 
 # ============================================================================
 # Integration Tests with Sample Tickets
@@ -828,16 +866,14 @@ class TestEdgeCases:
 class TestSampleTicketsExtraction:
     """Tests using sample tickets from fixtures."""
 
-    @pytest.mark.asyncio
-    async def test_complex_extraction_ticket(self, field_extractor, sample_tickets):
+    def test_complex_extraction_ticket(self, field_extractor, sample_tickets):
         """Test extraction from complex ticket with multiple fields."""
         ticket = sample_tickets["complex_extraction"]
 
-        result = await field_extractor.extract(
+        result = field_extractor.extract_sync(
             subject=ticket["subject"],
             body=ticket["body"],
             category=ticket.get("expected_category", "billing"),
-            use_ai=False,
         )
 
         expected_fields = ticket.get("expected_fields", [])
@@ -849,14 +885,24 @@ class TestSampleTicketsExtraction:
             )
 
     @pytest.mark.asyncio
-    async def test_all_sample_tickets_extraction(self, field_extractor, sample_tickets):
+    async def test_extract_many_matches_single_extraction(self, field_extractor, sample_tickets):
+        """Test that batch regex extraction matches per-ticket results."""
+        tickets = [
+            (ticket["subject"], ticket["body"], ticket.get("expected_category", "general"))
+            for ticket in sample_tickets.values()
+        ]
+
+        results = await field_extractor.extract_many(tickets, use_ai=False)
+
+        assert results == [field_extractor.extract_sync(*ticket) for ticket in tickets]
+
+    def test_all_sample_tickets_extraction(self, field_extractor, sample_tickets):
         """Test extraction across all sample tickets."""
         for ticket_id, ticket_data in sample_tickets.items():
-            result = await field_extractor.extract(
+            result = field_extractor.extract_sync(
                 subject=ticket_data["subject"],
                 body=ticket_data["body"],
                 category=ticket_data.get("expected_category", "general"),
-                use_ai=False,
             )
 
             assert isinstance(result, ExtractionResult)
@@ -451,6 +451,102 @@ class TestExtractedFieldsContext:
 
         assert isinstance(result, RoutingDecision)
 
+    def test_extracted_fields_do_not_leak_between_calls(self, ticket_router):
+        """Test cached decisions keep extracted-field context per call."""
+        with_fields = ticket_router.route(
+            subject="Order issue",
+            body="Problem with order",
+            category="billing",
+            severity="medium",
+            extracted_fields={"order_id": "ORD-123"},
+        )
+        without_fields = ticket_router.route(
+            subject="Order issue",
+            body="Problem with order",
+            category="billing",
+            severity="medium",
+        )
+
+        assert "order_id" in with_fields.reasoning
+        assert "order_id" not in without_fields.reasoning
+
+
+# ============================================================================
+# Decision Table Tests
+# ============================================================================
+
+
+class TestDecisionTable:
+    """Tests for precomputed routing decisions."""
+
+    def test_repeated_routes_are_equal(self, ticket_router):
+        """Test repeated routes for the same inputs return equal decisions."""
+        first = ticket_router.route("Issue", "Problem", "technical", "high")
+        second = ticket_router.route("Other", "Text", "technical", "high")
+
+        assert first == second
+
+    def test_repeated_routes_return_copies(self, ticket_router):
+        """Test callers cannot mutate the cached decision."""
+        first = ticket_router.route("Issue", "Problem", "technical", "high")
+        first.team = "billing_team"
+
+        second = ticket_router.route("Issue", "Problem", "technical", "high")
+
+        assert second is not first
+        assert second.team == "technical_support"
+
+    def test_repeated_routes_do_not_share_lists(self, ticket_router):
+        """Test mutating a returned decision's lists does not leak into later routes."""
+        first = ticket_router.route("Issue", "Problem", "technical", "high")
+        first.alternative_teams.append("HACKED")
+        first.escalation_path.append("HACKED")
+
+        second = ticket_router.route("Issue", "Problem", "technical", "high")
+
+        assert "HACKED" not in second.alternative_teams
+        assert "HACKED" not in second.escalation_path
+
+    def test_table_entries_unreachable_through_routes(self, ticket_router):
+        """Test mutating routed decisions leaves every table entry unchanged."""
+        snapshot = {
+            key: decision.model_dump()
+            for key, decision in ticket_router._decision_table.items()
+        }
+
+        for category, severity in snapshot:
+            for fields in (None, {"order_id": "ORD-12345"}):
+                decision = ticket_router.route("Issue", "Problem", category, severity, fields)
+                decision.alternative_teams.append("HACKED")
+                if decision.escalation_path is not None:
+                    decision.escalation_path.append("HACKED")
+
+        assert {
+            key: decision.model_dump()
+            for key, decision in ticket_router._decision_table.items()
+        } == snapshot
+
+    def test_known_pairs_are_precomputed(self, ticket_router, monkeypatch):
+        """Test known (category, severity) pairs are served from the table."""
+        assert len(ticket_router._decision_table) == (
+            len(CATEGORY_TEAM_MAP) * len(SEVERITY_PRIORITY_MAP)
+        )
+
+        def fail_compute(*args):
+            raise AssertionError("decision recomputed for a known pair")
+
+        monkeypatch.setattr(ticket_router, "_compute_decision", fail_compute)
+        for category in CATEGORY_TEAM_MAP:
+            for severity in SEVERITY_PRIORITY_MAP:
+                ticket_router.route("Issue", "Problem", category, severity)
+
+    def test_unknown_pair_matches_full_logic(self, ticket_router):
+        """Test pairs outside the table still use the full routing logic."""
+        result = ticket_router.route("Issue", "Problem", "unknown_category", "critical")
+
+        assert result.team == "escalation_team"
+        assert result == ticket_router._compute_decision("unknown_category", "critical")
+
 
 # ============================================================================
 # Helper Method Tests
@@ -488,6 +584,14 @@ class TestHelperMethods:
         assert "billing_team" in teams
         assert "escalation_team" in teams
 
+    def test_team_categories_are_frozen(self, ticket_router):
+        """Test team category sets are frozen without touching the defaults."""
+        for team_def in ticket_router.teams.values():
+            assert isinstance(team_def["categories"], frozenset)
+            assert isinstance(team_def["severities"], frozenset)
+
+        assert isinstance(DEFAULT_TEAMS["technical_support"]["categories"], list)
+
 
 # ============================================================================
 # Edge Cases Tests
@@ -620,6 +724,27 @@ class TestSampleTicketsRouting:
                 f"Ticket {ticket_id} should route to billing_team, got {result.team}"
             )
 
+    @pytest.mark.parametrize(
+        "ticket_by_kind, expected_team",
+        [
+            ("technical_high", "technical_support"),
+            ("billing_medium", "billing_team"),
+            ("account_medium", "account_management"),
+        ],
+        indirect=["ticket_by_kind"],
+    )
+    def test_sample_ticket_routes_to_category_team(
+        self, ticket_router, ticket_by_kind, expected_team
+    ):
+        """Test that non-critical sample tickets route to their category team."""
+        result = ticket_router.route(
+            subject=ticket_by_kind["subject"],
+            body=ticket_by_kind["body"],
+            category=ticket_by_kind["expected_category"],
+            severity=ticket_by_kind["expected_severity"],
+        )
+
+        assert result.team == expected_team
 
 # ============================================================================
 # Convenience Function Tests
@@ -657,6 +782,28 @@ class TestConvenienceFunction:
 
         assert isinstance(result, RoutingDecision)
 
+    def test_route_ticket_reuses_one_router(self, monkeypatch):
+        """Test route_ticket builds the router and its decision table only once."""
+        from app.services.workflow import routers
+
+        routers._default_router.cache_clear()
+        builds = []
+        original = routers.TicketRouter._build_decision_table
+
+        def counting_build(self):
+            builds.append(self)
+            return original(self)
+
+        monkeypatch.setattr(routers.TicketRouter, "_build_decision_table", counting_build)
+
+        first = routers.route_ticket("Billing issue", "Need refund", "billing", "medium")
+        first.alternative_teams.append("HACKED")
+        second = routers.route_ticket("Billing issue", "Need refund", "billing", "medium")
+
+        assert len(builds) == 1
+        assert "HACKED" not in second.alternative_teams
+        routers._default_router.cache_clear()
+
 
 # ============================================================================
 # Priority Modifier Tests